@@ -70,6 +70,10 @@ class Settings(BaseSettings):
         default="hybrid",
         description="Strategy mode: 'hybrid', 'maker_only', or 'taker_only'"
     )
+    polymarket_feed_process: bool = Field(
+        default=False,
+        description="Run the Polymarket WebSocket feed in its own process"
+    )
 
     # ==========================================
     # ORACLE LATENCY ARBITRAGE
@@ -8,14 +8,46 @@ This is the FASTEST source - always ahead of Polymarket oracle.
 
 import asyncio
 import json
-from decimal import Decimal
-from typing import Callable, Optional, Awaitable
+from typing import Callable, Optional, Awaitable, Tuple
 from datetime import datetime
 import websockets
 import structlog
 
+from src.utils.fast_json import json_loads as _json_loads
+
 logger = structlog.get_logger()
 
+_PRICE_KEY = b'"p":"'
+_TIME_KEY = b'"T":'
+
+
+def _extract_tick(message: bytes) -> Tuple[float, int]:
+    """
+    Pull price and trade time out of a raw aggTrade frame without parsing
+    the whole object.
+    
+    Raises:
+        ValueError: If either field is missing or malformed
+    """
+    start = message.find(_PRICE_KEY)
+    if start < 0:
+        raise ValueError("no price field")
+    start += len(_PRICE_KEY)
+    end = message.index(b'"', start)
+    price = float(message[start:end])
+    
+    # Binance emits "T" after "p"; anything else falls back to a full parse
+    start = message.find(_TIME_KEY, end)
+    if start < 0:
+        raise ValueError("no trade time field")
+    start += len(_TIME_KEY)
+    end = message.find(b",", start)
+    if end < 0:
+        end = message.index(b"}", start)
+    timestamp_ms = int(message[start:end])
+    
+    return price, timestamp_ms
+
 
 class BinancePriceFeed:
     """
@@ -27,7 +59,7 @@ class BinancePriceFeed:
     
     def __init__(
         self,
-        on_price_update: Callable[[Decimal, int], Awaitable[None]],
+        on_price_update: Callable[[float, int], Awaitable[None]],
         symbol: str = "btcusdt",
         wss_url: str = "wss://fstream.binance.com/ws"
     ):
@@ -42,7 +74,7 @@ class BinancePriceFeed:
         self.wss_url = wss_url
         
         # State
-        self.current_price: Decimal = Decimal("0")
+        self.current_price: float = 0.0
         self.last_update_ms: int = 0
         self._running = False
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
@@ -76,10 +108,9 @@ class BinancePriceFeed:
                     self._ws = ws
                     logger.info("binance_feed_connected")
                     
-                    async for message in ws:
-                        if not self._running:
-                            break
-                        
+                    # Raw UTF-8 payload straight into the parser
+                    while self._running:
+                        message = await ws.recv(decode=False)
                         await self._handle_message(message)
                         
             except websockets.ConnectionClosed as e:
@@ -102,14 +133,18 @@ class BinancePriceFeed:
         
         logger.info("binance_feed_stopped")
     
-    async def _handle_message(self, message: str):
-        """Process incoming aggTrade message."""
+    async def _handle_message(self, message: bytes):
+        """Process incoming aggTrade message (raw UTF-8 bytes)."""
         try:
-            data = json.loads(message)
-            
             # aggTrade format: {"e":"aggTrade","p":"95000.50","T":1737500000000,...}
-            price = Decimal(data["p"])
-            timestamp_ms = data["T"]
+            try:
+                price, timestamp_ms = _extract_tick(message)
+            except ValueError:
+                # Unexpected layout: fall back to a full parse
+                data = _json_loads(message)
+                data = data.get("data", data)  # combined-stream wrapper
+                price = float(data["p"])
+                timestamp_ms = data["T"]
             
             self.current_price = price
             self.last_update_ms = timestamp_ms
@@ -118,7 +153,7 @@ class BinancePriceFeed:
             # Callback to strategy
             await self.on_price_update(price, timestamp_ms)
             
-        except (json.JSONDecodeError, KeyError) as e:
+        except (json.JSONDecodeError, KeyError, ValueError) as e:
             logger.warning("binance_message_parse_error", error=str(e))
     
     def stop(self):
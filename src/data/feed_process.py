@@ -0,0 +1,389 @@
+"""
+Polymarket Feed Process
+========================
+
+Runs PolymarketFeed in a child process so its WebSocket reads never
+compete with the Binance feed and the strategy for the main event loop.
+
+The child writes each book update into a shared-memory SoA block guarded
+by a seqlock and sets an Event; the main process copies the latest book
+into an OrderBook when woken. Subscriptions are sent down a command queue.
+"""
+
+import asyncio
+import multiprocessing as mp
+import queue
+import time
+from multiprocessing import shared_memory
+from typing import Awaitable, Callable, Optional, Set, Tuple
+
+import numpy as np
+import structlog
+
+from src.data.orderbook import OrderBook
+
+logger = structlog.get_logger()
+
+# Shared block layout: int64 header, token id bytes, then four float64
+# arrays (bid_px, bid_sz, ask_px, ask_sz) of `capacity` levels each.
+_HDR_SEQ = 0
+_HDR_N_BIDS = 1
+_HDR_N_ASKS = 2
+_HDR_TOKEN_LEN = 3
+_HEADER_WORDS = 4
+_TOKEN_BYTES = 128
+
+_CMD_SUBSCRIBE = "subscribe"
+_CMD_UNSUBSCRIBE = "unsubscribe"
+_CMD_STOP = "stop"
+
+# Seqlock read attempts per wake before backing off to the event loop
+_READ_SPINS = 16
+
+# Backoff (seconds) between wakes whose reads all hit a write in progress
+_RETRY_DELAY_MIN = 0.0005
+_RETRY_DELAY_MAX = 0.05
+
+# Pause before restarting a child process that died
+_RESTART_DELAY = 1.0
+
+
+class _BookBlock:
+    """Numpy views over the shared-memory book block."""
+    
+    def __init__(self, buf, capacity: int):
+        self.header = np.ndarray(_HEADER_WORDS, dtype=np.int64, buffer=buf)
+        self.token = np.ndarray(
+            _TOKEN_BYTES, dtype=np.uint8, buffer=buf, offset=_HEADER_WORDS * 8
+        )
+        levels = np.ndarray(
+            4 * capacity,
+            dtype=np.float64,
+            buffer=buf,
+            offset=_HEADER_WORDS * 8 + _TOKEN_BYTES
+        )
+        self.bid_px = levels[0:capacity]
+        self.bid_sz = levels[capacity:2 * capacity]
+        self.ask_px = levels[2 * capacity:3 * capacity]
+        self.ask_sz = levels[3 * capacity:]
+        self.capacity = capacity
+    
+    @staticmethod
+    def size(capacity: int) -> int:
+        """Bytes needed for a block of `capacity` levels per side."""
+        return _HEADER_WORDS * 8 + _TOKEN_BYTES + 4 * capacity * 8
+
+
+def _best_levels(
+    prices: np.ndarray,
+    sizes: np.ndarray,
+    capacity: int,
+    is_bid: bool
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Keep the `capacity` best levels of a price-sorted side that doesn't fit."""
+    if len(prices) <= capacity:
+        return prices, sizes
+    # Ascending by price: best bids at the end, best asks at the start
+    if is_bid:
+        return prices[-capacity:], sizes[-capacity:]
+    return prices[:capacity], sizes[:capacity]
+
+
+def _run_feed_process(
+    shm_name: str,
+    capacity: int,
+    wss_url: str,
+    commands,
+    updated
+):
+    """Child process entry point: run the feed, publish books to shared memory."""
+    from src.data.polymarket_feed import PolymarketFeed
+    
+    shm = shared_memory.SharedMemory(name=shm_name)
+    block = _BookBlock(shm.buf, capacity)
+    header = block.header
+    
+    async def publish(token_id: str, orderbook: dict):
+        bid_px, bid_sz = _best_levels(
+            orderbook["bid_prices"], orderbook["bid_sizes"], capacity, True
+        )
+        ask_px, ask_sz = _best_levels(
+            orderbook["ask_prices"], orderbook["ask_sizes"], capacity, False
+        )
+        token = token_id.encode()[:_TOKEN_BYTES]
+        
+        n_bids = len(bid_px)
+        n_asks = len(ask_px)
+        
+        header[_HDR_SEQ] += 1  # odd: write in progress
+        block.bid_px[:n_bids] = bid_px
+        block.bid_sz[:n_bids] = bid_sz
+        block.ask_px[:n_asks] = ask_px
+        block.ask_sz[:n_asks] = ask_sz
+        block.token[:len(token)] = np.frombuffer(token, dtype=np.uint8)
+        header[_HDR_N_BIDS] = n_bids
+        header[_HDR_N_ASKS] = n_asks
+        header[_HDR_TOKEN_LEN] = len(token)
+        header[_HDR_SEQ] += 1  # even: consistent
+        
+        updated.set()
+    
+    async def main():
+        feed = PolymarketFeed(on_orderbook_update=publish, wss_url=wss_url)
+        feed_task = asyncio.create_task(feed.connect())
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            cmd, token_id = await loop.run_in_executor(None, commands.get)
+            if cmd == _CMD_SUBSCRIBE:
+                await feed.subscribe(token_id)
+            elif cmd == _CMD_UNSUBSCRIBE:
+                await feed.unsubscribe(token_id)
+            elif cmd == _CMD_STOP:
+                feed.stop()
+                break
+        
+        await asyncio.wait([feed_task], timeout=5)
+    
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        try:
+            shm.close()
+        except BufferError:
+            pass  # views still referenced; released at process exit
+
+
+class PolymarketFeedProcess:
+    """
+    PolymarketFeed running in a child process.
+    
+    Mirrors the subscribe/connect/stop interface of PolymarketFeed, but
+    delivers books by refilling the given OrderBook in place. A child that
+    dies is restarted and resubscribed, like the feed's own reconnects.
+    """
+    
+    def __init__(
+        self,
+        orderbook: OrderBook,
+        wss_url: str,
+        on_update: Optional[Callable[[str], Awaitable[None]]] = None,
+        capacity: int = 1024
+    ):
+        """
+        Args:
+            orderbook: Book refilled with the latest update from the child
+            wss_url: Polymarket WebSocket URL
+            on_update: Optional async callback(token_id) after each refill
+            capacity: Max levels per side kept in shared memory
+        """
+        self.orderbook = orderbook
+        self.wss_url = wss_url
+        self.on_update = on_update
+        self.capacity = capacity
+        
+        # spawn: never fork a process that has a running event loop
+        self._ctx = mp.get_context("spawn")
+        self._commands = self._ctx.Queue()
+        self._updated = self._ctx.Event()
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._block: Optional[_BookBlock] = None
+        self._process: Optional[mp.process.BaseProcess] = None
+        self._running = False
+        self._tokens: Set[str] = set()  # resubscribed after a restart
+        
+        # Private copy target for seqlock reads; the live book is only
+        # touched once a read is known to be consistent
+        self._scratch = OrderBook(capacity)
+        
+        # Stats
+        self.updates_received = 0
+        self.torn_reads = 0
+        self.restarts = 0
+    
+    async def subscribe(self, token_id: str):
+        """Subscribe to order book updates for a token."""
+        self._tokens.add(token_id)
+        self._commands.put((_CMD_SUBSCRIBE, token_id))
+    
+    async def unsubscribe(self, token_id: str):
+        """Unsubscribe from a token."""
+        self._tokens.discard(token_id)
+        self._commands.put((_CMD_UNSUBSCRIBE, token_id))
+    
+    async def connect(self):
+        """
+        Start the child process and deliver its updates until stopped.
+        """
+        self._shm = shared_memory.SharedMemory(
+            create=True, size=_BookBlock.size(self.capacity)
+        )
+        self._block = _BookBlock(self._shm.buf, self.capacity)
+        
+        self._start_process()
+        self._running = True
+        
+        logger.info("polymarket_feed_process_started", pid=self._process.pid)
+        
+        loop = asyncio.get_running_loop()
+        retry_delay = _RETRY_DELAY_MIN
+        try:
+            while self._running:
+                woke = await loop.run_in_executor(None, self._updated.wait, 0.5)
+                if not self._running:
+                    break
+                
+                # A child killed mid-write leaves the sequence odd forever
+                if not self._process.is_alive():
+                    await self._restart_process()
+                    continue
+                
+                if not woke:
+                    continue
+                self._updated.clear()
+                
+                token_id = self._read_book()
+                if token_id is None:
+                    # Writer stalled mid-update: back off without blocking
+                    # the loop (_read_book re-set the event to retry)
+                    await asyncio.sleep(retry_delay)
+                    retry_delay = min(2 * retry_delay, _RETRY_DELAY_MAX)
+                    continue
+                retry_delay = _RETRY_DELAY_MIN
+                
+                self.updates_received += 1
+                if self.on_update:
+                    await self.on_update(token_id)
+        finally:
+            await self._close()
+    
+    def _start_process(self):
+        """Start a child process on a cleared shared block."""
+        self._block.header[:] = 0
+        self._updated.clear()
+        
+        self._process = self._ctx.Process(
+            target=_run_feed_process,
+            args=(
+                self._shm.name,
+                self.capacity,
+                self.wss_url,
+                self._commands,
+                self._updated
+            ),
+            name="polymarket-feed",
+            daemon=True
+        )
+        self._process.start()
+    
+    async def _restart_process(self):
+        """Replace a dead child and resend the current subscriptions."""
+        self.restarts += 1
+        logger.warning(
+            "polymarket_feed_process_died",
+            exitcode=self._process.exitcode,
+            restarts=self.restarts
+        )
+        await asyncio.sleep(_RESTART_DELAY)
+        if not self._running:
+            return
+        
+        self._start_process()
+        for token_id in self._tokens:
+            self._commands.put((_CMD_SUBSCRIBE, token_id))
+        
+        logger.info("polymarket_feed_process_started", pid=self._process.pid)
+    
+    def _read_book(self) -> Optional[str]:
+        """
+        Seqlock read of the shared block into the OrderBook.
+        
+        Copies into a private scratch book first and publishes to the live
+        book only if the sequence didn't move during the copy. If no
+        consistent read succeeds, the live book keeps its previous state
+        and the update event is re-set so the next wake retries (after
+        connect's backoff). Stops early if the writer process is dead.
+        """
+        block = self._block
+        header = block.header
+        scratch = self._scratch
+        
+        for _ in range(_READ_SPINS):
+            seq = int(header[_HDR_SEQ])
+            if seq == 0:
+                return None  # nothing published yet
+            if seq & 1:
+                if not self._process.is_alive():
+                    break  # died mid-write: connect restarts it
+                time.sleep(0)  # writer mid-update: yield, then retry
+                continue
+            
+            n_bids = min(int(header[_HDR_N_BIDS]), self.capacity)
+            n_asks = min(int(header[_HDR_N_ASKS]), self.capacity)
+            token_len = min(int(header[_HDR_TOKEN_LEN]), _TOKEN_BYTES)
+            token = block.token[:token_len].tobytes()
+            
+            scratch.load_arrays(
+                "",
+                block.bid_px[:n_bids],
+                block.bid_sz[:n_bids],
+                block.ask_px[:n_asks],
+                block.ask_sz[:n_asks],
+                presorted=True
+            )
+            
+            if int(header[_HDR_SEQ]) != seq:
+                self.torn_reads += 1
+                time.sleep(0)
+                continue
+            
+            # Consistent snapshot: publish it to the live book
+            token_id = token.decode()
+            self.orderbook.load_arrays(
+                token_id,
+                scratch.bid_px[:n_bids],
+                scratch.bid_sz[:n_bids],
+                scratch.ask_px[:n_asks],
+                scratch.ask_sz[:n_asks],
+                presorted=True
+            )
+            return token_id
+        
+        self._updated.set()
+        return None
+    
+    def stop(self):
+        """Stop the child process and the delivery loop."""
+        self._running = False
+        try:
+            self._commands.put_nowait((_CMD_STOP, ""))
+        except (ValueError, queue.Full):
+            pass
+    
+    async def _close(self):
+        """Join the child and release shared memory."""
+        if self._process is not None:
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._process.join, 5)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
+        
+        if self._shm is not None:
+            self._block = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+        
+        logger.info("polymarket_feed_process_stopped")
+    
+    def get_stats(self) -> dict:
+        """Return feed statistics."""
+        return {
+            "updates_received": self.updates_received,
+            "torn_reads": self.torn_reads,
+            "restarts": self.restarts,
+            "process_alive": bool(self._process and self._process.is_alive())
+        }
@@ -0,0 +1,117 @@
+"""
+Order Book Buffer
+==================
+
+Struct-of-arrays view of one token's order book.
+
+The feed hands us a dict of parallel price/size arrays; the strategy engines only need
+contiguous price/size vectors, so the levels are copied into preallocated
+float64 arrays once per update and reused on every tick.
+
+Both sides are kept sorted ascending by price, so the best bid is the last
+valid bid slot and the best ask the first ask slot: O(1) lookups.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+
+class OrderBook:
+    """
+    Preallocated SoA order book, refilled in place on each update.
+    
+    Only the first n_bids / n_asks slots of each array are valid, sorted
+    ascending by price on both sides.
+    """
+    
+    def __init__(self, capacity: int = 32):
+        """
+        Args:
+            capacity: Initial number of levels per side (grows if exceeded)
+        """
+        self.token_id: str = ""
+        self.bid_px = np.empty(capacity, dtype=np.float64)
+        self.bid_sz = np.empty(capacity, dtype=np.float64)
+        self.ask_px = np.empty(capacity, dtype=np.float64)
+        self.ask_sz = np.empty(capacity, dtype=np.float64)
+        self.n_bids = 0
+        self.n_asks = 0
+    
+    def load(self, orderbook: dict):
+        """
+        Copy a feed orderbook dict into the arrays.
+        
+        Args:
+            orderbook: {"token_id", "bid_prices", "bid_sizes", "ask_prices",
+                "ask_sizes"} with float64 arrays sorted ascending by price
+                (as PolymarketFeed emits them)
+        """
+        self.load_arrays(
+            orderbook.get("token_id", ""),
+            orderbook["bid_prices"], orderbook["bid_sizes"],
+            orderbook["ask_prices"], orderbook["ask_sizes"],
+            presorted=True
+        )
+    
+    def load_arrays(
+        self,
+        token_id: str,
+        bid_px: np.ndarray,
+        bid_sz: np.ndarray,
+        ask_px: np.ndarray,
+        ask_sz: np.ndarray,
+        presorted: bool = False
+    ):
+        """
+        Copy levels that are already in array form (e.g. shared memory).
+        
+        Args:
+            token_id: Token the book belongs to
+            bid_px, bid_sz: Valid bid levels only
+            ask_px, ask_sz: Valid ask levels only
+            presorted: Levels are already ascending by price (skip the sort)
+        """
+        n_bids = len(bid_px)
+        n_asks = len(ask_px)
+        
+        needed = max(n_bids, n_asks)
+        if needed > len(self.bid_px):
+            self._grow(needed)
+        
+        if not presorted:
+            order = np.argsort(bid_px, kind="stable")
+            bid_px, bid_sz = bid_px[order], bid_sz[order]
+            order = np.argsort(ask_px, kind="stable")
+            ask_px, ask_sz = ask_px[order], ask_sz[order]
+        
+        self.bid_px[:n_bids] = bid_px
+        self.bid_sz[:n_bids] = bid_sz
+        self.ask_px[:n_asks] = ask_px
+        self.ask_sz[:n_asks] = ask_sz
+        self.n_bids = n_bids
+        self.n_asks = n_asks
+        self.token_id = token_id
+    
+    def _grow(self, needed: int):
+        """Reallocate all four arrays to at least `needed` slots."""
+        capacity = max(needed, 2 * len(self.bid_px))
+        self.bid_px = np.empty(capacity, dtype=np.float64)
+        self.bid_sz = np.empty(capacity, dtype=np.float64)
+        self.ask_px = np.empty(capacity, dtype=np.float64)
+        self.ask_sz = np.empty(capacity, dtype=np.float64)
+    
+    def best_bid(self) -> Optional[float]:
+        """Highest bid price, or None if there are no bids."""
+        if not self.n_bids:
+            return None
+        return float(self.bid_px[self.n_bids - 1])
+    
+    def best_ask(self) -> Optional[float]:
+        """Lowest ask price, or None if there are no asks."""
+        if not self.n_asks:
+            return None
+        return float(self.ask_px[0])
+    
+    def __bool__(self) -> bool:
+        return bool(self.token_id)
@@ -7,14 +7,51 @@ Real-time order book and trade updates from Polymarket CLOB.
 
 import asyncio
 import json
-from decimal import Decimal
-from typing import Callable, Optional, Dict, List, Awaitable
-from datetime import datetime
+from collections import OrderedDict
+from typing import Callable, Optional, Dict, Set, Awaitable, Tuple
+import numpy as np
 import websockets
 import structlog
 
+from src.utils.clock import iso_now_cached
+from src.utils.fast_json import json_loads as _json_loads
+
 logger = structlog.get_logger()
 
+# price_change "side" -> (prices key, sizes key) of the book side it touches
+_SIDE_KEYS = {
+    "BUY": ("bid_prices", "bid_sizes"),
+    "SELL": ("ask_prices", "ask_sizes")
+}
+
+
+def apply_level_change(
+    prices: np.ndarray,
+    sizes: np.ndarray,
+    price: float,
+    size: float
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Set one price level on a price-sorted side (size 0 removes it).
+    
+    Binary search instead of re-parsing the side; updates in place when
+    the level exists, otherwise returns new arrays with it inserted.
+    
+    Returns:
+        (prices, sizes), possibly new objects
+    """
+    i = int(np.searchsorted(prices, price))
+    exists = i < len(prices) and prices[i] == price
+    
+    if size <= 0:
+        if exists:
+            return np.delete(prices, i), np.delete(sizes, i)
+        return prices, sizes
+    if exists:
+        sizes[i] = size
+        return prices, sizes
+    return np.insert(prices, i, price), np.insert(sizes, i, size)
+
 
 class PolymarketFeed:
     """
@@ -27,23 +64,40 @@ class PolymarketFeed:
     def __init__(
         self,
         on_orderbook_update: Callable[[str, dict], Awaitable[None]],
-        wss_url: str = "wss://ws-subscriptions-clob.polymarket.com/ws/"
+        wss_url: str = "wss://ws-subscriptions-clob.polymarket.com/ws/",
+        max_books: int = 256
     ):
         """
         Args:
-            on_orderbook_update: Async callback(token_id, orderbook) on update
+            on_orderbook_update: Async callback(token_id, orderbook) on update.
+                The orderbook dict is reused across updates for the same
+                token - treat it as read-only and copy before mutating.
+                Levels are parallel float64 arrays "bid_prices"/"bid_sizes"
+                and "ask_prices"/"ask_sizes", sorted ascending by price.
             wss_url: Polymarket WebSocket URL
+            max_books: Max cached orderbooks (least recently updated evicted)
         """
         self.on_orderbook_update = on_orderbook_update
         self.wss_url = wss_url
+        self._max_books = max_books
         
         # State
         self._running = False
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
-        self._subscribed_tokens: List[str] = []
+        self._subscribed_tokens: Set[str] = set()
         
-        # Local orderbook cache
-        self._orderbooks: Dict[str, dict] = {}
+        # Local orderbook cache (LRU, bounded by max_books)
+        self._orderbooks: "OrderedDict[str, dict]" = OrderedDict()
+        
+        # Top-of-book signature per token, to drop no-op price_change frames
+        self._book_sig: Dict[str, int] = {}
+        
+        # Message dispatch by "type" (one dict lookup per frame)
+        self._handlers: Dict[str, Callable[[dict], Awaitable[None]]] = {
+            "book": self._on_book,
+            "price_change": self._on_price_change,
+            "error": self._on_error
+        }
         
         # Stats
         self.messages_received = 0
@@ -60,8 +114,15 @@ class PolymarketFeed:
         
         while self._running:
             try:
+                # No permessage-deflate: skips a zlib inflate per frame.
+                # Unbounded max_size for full book snapshots, deeper
+                # max_queue so bursts don't stall the reader.
                 async with websockets.connect(
                     self.wss_url,
+                    compression=None,
+                    max_size=None,
+                    max_queue=256,
+                    write_limit=2**18,
                     ping_interval=30,
                     ping_timeout=10,
                     close_timeout=5
@@ -69,21 +130,17 @@ class PolymarketFeed:
                     self._ws = ws
                     logger.info("polymarket_feed_connected")
                     
-                    # Re-subscribe to tokens on reconnect
-                    for token_id in self._subscribed_tokens:
+                    # Re-subscribe to tokens on reconnect (copy: subscribe()
+                    # may add to the set while we await the sends)
+                    for token_id in tuple(self._subscribed_tokens):
                         await self._send_subscribe(token_id)
                     
-                    # Start ping task
-                    ping_task = asyncio.create_task(self._ping_loop())
-                    
-                    try:
-                        async for message in ws:
-                            if not self._running:
-                                break
-                            
-                            await self._handle_message(message)
-                    finally:
-                        ping_task.cancel()
+                    # Keepalive is handled by the library (ping_interval).
+                    # decode=False hands us the raw UTF-8 payload, so the
+                    # frame is never decoded to str before parsing.
+                    while self._running:
+                        message = await ws.recv(decode=False)
+                        await self._handle_message(message)
                         
             except websockets.ConnectionClosed as e:
                 if self._running:
@@ -105,20 +162,9 @@ class PolymarketFeed:
         
         logger.info("polymarket_feed_stopped")
     
-    async def _ping_loop(self):
-        """Keep connection alive with pings."""
-        while self._running and self._ws:
-            try:
-                await asyncio.sleep(25)
-                if self._ws:
-                    await self._ws.ping()
-            except Exception:
-                break
-    
     async def subscribe(self, token_id: str):
         """Subscribe to order book updates for a token."""
-        if token_id not in self._subscribed_tokens:
-            self._subscribed_tokens.append(token_id)
+        self._subscribed_tokens.add(token_id)
         
         if self._ws:
             await self._send_subscribe(token_id)
@@ -140,8 +186,8 @@ class PolymarketFeed:
     
     async def unsubscribe(self, token_id: str):
         """Unsubscribe from a token."""
-        if token_id in self._subscribed_tokens:
-            self._subscribed_tokens.remove(token_id)
+        self._subscribed_tokens.discard(token_id)
+        self._drop_book(token_id)
         
         if self._ws:
             unsubscribe_msg = {
@@ -151,64 +197,128 @@ class PolymarketFeed:
             }
             await self._ws.send(json.dumps(unsubscribe_msg))
     
-    async def _handle_message(self, message: str):
-        """Process incoming WebSocket message."""
+    async def _handle_message(self, message: bytes):
+        """Process incoming WebSocket message (raw UTF-8 bytes)."""
         try:
-            data = json.loads(message)
+            data = _json_loads(message)
             self.messages_received += 1
             
-            msg_type = data.get("type", "")
-            
-            if msg_type == "book":
-                # Order book update
-                token_id = data.get("market", "")
-                
-                orderbook = {
-                    "token_id": token_id,
-                    "bids": self._parse_orders(data.get("bids", [])),
-                    "asks": self._parse_orders(data.get("asks", [])),
-                    "timestamp": datetime.now().isoformat()
-                }
-                
-                self._orderbooks[token_id] = orderbook
-                
-                await self.on_orderbook_update(token_id, orderbook)
-                
-            elif msg_type == "price_change":
-                # Price update (simpler than full book)
-                token_id = data.get("market", "")
-                
-                if token_id in self._orderbooks:
-                    # Update existing book
-                    if "price" in data:
-                        self._orderbooks[token_id]["last_price"] = data["price"]
-                    
-                    await self.on_orderbook_update(
-                        token_id,
-                        self._orderbooks[token_id]
-                    )
-            
-            elif msg_type == "error":
-                logger.warning("polymarket_ws_error", data=data)
+            handler = self._handlers.get(data.get("type"))
+            if handler is not None:
+                await handler(data)
                 
-        except (json.JSONDecodeError, KeyError) as e:
+        except (ValueError, KeyError) as e:  # incl. JSONDecodeError, bad levels
             logger.warning("polymarket_message_parse_error", error=str(e))
     
-    def _parse_orders(self, orders: list) -> List[dict]:
-        """Parse order list to standard format."""
-        parsed = []
+    async def _on_book(self, data: dict):
+        """Full order book snapshot."""
+        token_id = data["market"]
+        
+        # One dict per token, updated in place on every snapshot
+        orderbook = self._orderbooks.get(token_id)
+        if orderbook is None:
+            orderbook = {
+                "token_id": token_id,
+                "bid_prices": None,
+                "bid_sizes": None,
+                "ask_prices": None,
+                "ask_sizes": None,
+                "timestamp": ""
+            }
+        
+        orderbook["bid_prices"], orderbook["bid_sizes"] = self._parse_orders(data["bids"])
+        orderbook["ask_prices"], orderbook["ask_sizes"] = self._parse_orders(data["asks"])
+        orderbook["timestamp"] = iso_now_cached()
+        
+        self._store_book(token_id, orderbook)
+        
+        # Snapshots always go downstream (e.g. fresh book after reconnect)
+        self._book_sig[token_id] = self._book_signature(orderbook)
+        
+        await self.on_orderbook_update(token_id, orderbook)
+    
+    async def _on_price_change(self, data: dict):
+        """Price update: level deltas applied to the cached book."""
+        token_id = data["market"]
+        orderbook = self._orderbooks.get(token_id)
+        if orderbook is None:
+            return
+        self._orderbooks.move_to_end(token_id)
+        
+        if "price" in data:
+            orderbook["last_price"] = data["price"]
+        
+        # Incremental level updates, if the frame carries them
+        for change in data.get("changes") or data.get("price_changes") or ():
+            keys = _SIDE_KEYS.get(change.get("side"))
+            if keys is not None:
+                px_key, sz_key = keys
+                orderbook[px_key], orderbook[sz_key] = apply_level_change(
+                    orderbook[px_key],
+                    orderbook[sz_key],
+                    float(change["price"]),
+                    float(change["size"])
+                )
+        
+        # Re-broadcast of an unchanged book: skip the strategy callback
+        sig = self._book_signature(orderbook)
+        if self._book_sig.get(token_id) == sig:
+            return
+        self._book_sig[token_id] = sig
+        
+        await self.on_orderbook_update(token_id, orderbook)
+    
+    def _store_book(self, token_id: str, orderbook: dict):
+        """Insert/refresh a book as most recent; evict the oldest beyond the cap."""
+        books = self._orderbooks
+        books[token_id] = orderbook
+        books.move_to_end(token_id)
+        
+        while len(books) > self._max_books:
+            evicted, _ = books.popitem(last=False)
+            self._book_sig.pop(evicted, None)
+    
+    def _drop_book(self, token_id: str):
+        """Forget cached state for a token."""
+        self._orderbooks.pop(token_id, None)
+        self._book_sig.pop(token_id, None)
+    
+    @staticmethod
+    def _book_signature(orderbook: dict) -> int:
+        """Hash of best bid/ask (price, size), depth and last trade price."""
+        bid_prices = orderbook["bid_prices"]
+        ask_prices = orderbook["ask_prices"]
+        n_bids = len(bid_prices)
+        n_asks = len(ask_prices)
+        
+        # Sorted ascending: best bid is last, best ask first
+        return hash((
+            (bid_prices[-1], orderbook["bid_sizes"][-1]) if n_bids else None,
+            (ask_prices[0], orderbook["ask_sizes"][0]) if n_asks else None,
+            n_bids, n_asks,
+            orderbook.get("last_price")
+        ))
+    
+    async def _on_error(self, data: dict):
+        """Server-side error frame."""
+        logger.warning("polymarket_ws_error", data=data)
+    
+    def _parse_orders(self, orders: list) -> Tuple[np.ndarray, np.ndarray]:
+        """Parse order list into price-sorted (prices, sizes) float64 arrays."""
+        prices = []
+        sizes = []
         for order in orders:
             if isinstance(order, dict):
-                parsed.append({
-                    "price": Decimal(str(order.get("price", 0))),
-                    "size": Decimal(str(order.get("size", 0)))
-                })
+                prices.append(float(order.get("price", 0)))
+                sizes.append(float(order.get("size", 0)))
             elif isinstance(order, (list, tuple)) and len(order) >= 2:
-                parsed.append({
-                    "price": Decimal(str(order[0])),
-                    "size": Decimal(str(order[1]))
-                })
-        return parsed
+                prices.append(float(order[0]))
+                sizes.append(float(order[1]))
+        
+        prices = np.array(prices, dtype=np.float64)
+        sizes = np.array(sizes, dtype=np.float64)
+        order = np.argsort(prices, kind="stable")
+        return prices[order], sizes[order]
     
     def get_orderbook(self, token_id: str) -> Optional[dict]:
         """Get cached orderbook for a token."""
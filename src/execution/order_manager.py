@@ -7,7 +7,7 @@ the Polymarket CLOB API.
 """
 
 from decimal import Decimal
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime
 import asyncio
 import structlog
@@ -17,10 +17,13 @@ from py_clob_client.clob_types import (
     OrderArgs,
     MarketOrderArgs,
     OrderType,
-    OpenOrderParams
+    OpenOrderParams,
+    PostOrdersArgs
 )
 from py_clob_client.order_builder.constants import BUY, SELL
 
+from src.utils.clock import iso_now_cached
+
 logger = structlog.get_logger()
 
 
@@ -57,6 +60,11 @@ class OrderManager:
         self.active_orders: Dict[str, dict] = {}
         self.order_history: List[dict] = []
         
+        # Reusable OrderArgs per (token_id, side); only price/size change
+        # between re-quotes. create_order reads the args synchronously and
+        # keeps no reference, so mutating the template is safe.
+        self._args_tpl: Dict[Tuple[str, str], OrderArgs] = {}
+        
         # Stats
         self.orders_placed = 0
         self.orders_canceled = 0
@@ -142,48 +150,20 @@ class OrderManager:
                 size=size
             )
             
-            self.orders_placed += 1
-            self.active_orders[order_id] = {
-                "order_id": order_id,
-                "token_id": token_id,
-                "side": side,
-                "price": price,
-                "size": size,
-                "type": "limit",
-                "status": "open",
-                "timestamp": datetime.now().isoformat()
-            }
+            self._track_limit_order(order_id, token_id, side, price, size)
             
             return {"success": True, "order_id": order_id}
         
         try:
             # Real order
-            order_side = BUY if side.upper() == "BUY" else SELL
-            
-            order_args = OrderArgs(
-                token_id=token_id,
-                price=price,
-                size=size,
-                side=order_side
-            )
+            order_args = self._order_args(token_id, side, price, size)
             
             signed_order = self.client.create_order(order_args)
             response = self.client.post_order(signed_order, OrderType.GTC)
             
             if response and response.get("orderID"):
                 order_id = response["orderID"]
-                self.orders_placed += 1
-                
-                self.active_orders[order_id] = {
-                    "order_id": order_id,
-                    "token_id": token_id,
-                    "side": side,
-                    "price": price,
-                    "size": size,
-                    "type": "limit",
-                    "status": "open",
-                    "timestamp": datetime.now().isoformat()
-                }
+                self._track_limit_order(order_id, token_id, side, price, size)
                 
                 if self.risk_manager:
                     self.risk_manager.record_trade_opened(price * size)
@@ -205,6 +185,171 @@ class OrderManager:
             logger.error("limit_order_exception", error=str(e))
             return {"success": False, "error": str(e)}
     
+    async def place_limit_orders_batch(self, quotes: list) -> List[dict]:
+        """
+        Place several limit orders with one signed batch request.
+        
+        Each quote is risk-checked on its own; the accepted ones go to the
+        CLOB batch endpoint together (one round-trip instead of N).
+        
+        Args:
+            quotes: Items with token_id, side, price, size (e.g. Quote)
+        
+        Returns:
+            Result dict per quote, in input order
+        """
+        if not quotes:
+            return []
+        
+        results: List[dict] = [None] * len(quotes)
+        accepted = []  # (index, token_id, side, price, size)
+        batch_buys = 0  # BUYs accepted so far; not yet in open_positions
+        
+        for i, quote in enumerate(quotes):
+            token_id = quote.token_id
+            side = quote.side
+            price = float(quote.price)
+            size = float(quote.size)
+            
+            if self.risk_manager:
+                # Positions are only recorded once the batch is posted, so
+                # the BUYs already accepted here count as pending
+                valid, reason = self.risk_manager.validate_trade(
+                    price, size, 0.0, side,  # No fee for maker
+                    pending_positions=batch_buys
+                )
+                
+                if not valid:
+                    logger.warning(
+                        "order_rejected_risk",
+                        reason=reason,
+                        token_id=token_id[:16] + "...",
+                        side=side,
+                        price=price,
+                        size=size
+                    )
+                    results[i] = {"success": False, "error": reason}
+                    continue
+            
+            # Charged per order, so the orders-per-second cap still holds
+            await self._rate_limit_check()
+            
+            accepted.append((i, token_id, side, price, size))
+            if side == "BUY":
+                batch_buys += 1
+        
+        if not accepted:
+            return results
+        
+        if self.dry_run:
+            now = datetime.now().timestamp()
+            for i, token_id, side, price, size in accepted:
+                order_id = f"DRY_{now}_{i}"
+                
+                logger.info(
+                    "dry_run_limit_order",
+                    order_id=order_id,
+                    token_id=token_id[:16] + "...",
+                    side=side,
+                    price=price,
+                    size=size
+                )
+                
+                self._track_limit_order(order_id, token_id, side, price, size)
+                results[i] = {"success": True, "order_id": order_id}
+            
+            return results
+        
+        try:
+            batch = [
+                PostOrdersArgs(
+                    order=self.client.create_order(
+                        self._order_args(token_id, side, price, size)
+                    ),
+                    orderType=OrderType.GTC
+                )
+                for _, token_id, side, price, size in accepted
+            ]
+            responses = self.client.post_orders(batch) or []
+        except Exception as e:
+            logger.error("batch_order_exception", error=str(e), count=len(accepted))
+            for i, *_ in accepted:
+                results[i] = {"success": False, "error": str(e)}
+            return results
+        
+        # The endpoint answers with one entry per posted order, in order
+        for n, (i, token_id, side, price, size) in enumerate(accepted):
+            response = responses[n] if n < len(responses) else None
+            
+            if response and response.get("orderID"):
+                order_id = response["orderID"]
+                self._track_limit_order(order_id, token_id, side, price, size)
+                
+                if self.risk_manager:
+                    self.risk_manager.record_trade_opened(price * size)
+                
+                logger.info(
+                    "limit_order_placed",
+                    order_id=order_id,
+                    side=side,
+                    price=price,
+                    size=size
+                )
+                
+                results[i] = {"success": True, "order_id": order_id}
+            else:
+                logger.error("limit_order_failed", response=response)
+                results[i] = {"success": False, "error": str(response)}
+        
+        return results
+    
+    def _track_limit_order(
+        self,
+        order_id: str,
+        token_id: str,
+        side: str,
+        price: float,
+        size: float
+    ):
+        """Record a newly placed limit order as active."""
+        self.orders_placed += 1
+        self.active_orders[order_id] = {
+            "order_id": order_id,
+            "token_id": token_id,
+            "side": side,
+            "price": price,
+            "size": size,
+            "type": "limit",
+            "status": "open",
+            "timestamp": iso_now_cached()
+        }
+    
+    def _order_args(
+        self,
+        token_id: str,
+        side: str,
+        price: float,
+        size: float
+    ) -> OrderArgs:
+        """Return the pooled OrderArgs for (token_id, side) with price/size set."""
+        key = (token_id, side)
+        order_args = self._args_tpl.get(key)
+        
+        if order_args is None:
+            order_side = BUY if side.upper() == "BUY" else SELL
+            order_args = OrderArgs(
+                token_id=token_id,
+                price=price,
+                size=size,
+                side=order_side
+            )
+            self._args_tpl[key] = order_args
+        else:
+            order_args.price = price
+            order_args.size = size
+        
+        return order_args
+    
     async def place_market_order(
         self,
         token_id: str,
@@ -344,6 +489,53 @@ class OrderManager:
             )
             return False
     
+    async def cancel_orders_batch(self, order_ids: List[str]) -> List[str]:
+        """
+        Cancel several orders with one request.
+        
+        Args:
+            order_ids: Order IDs to cancel
+        
+        Returns:
+            IDs that were actually canceled
+        """
+        if not order_ids:
+            return []
+        
+        await self._rate_limit_check()
+        
+        if self.dry_run:
+            canceled = [
+                order_id for order_id in order_ids
+                if self.active_orders.pop(order_id, None) is not None
+            ]
+            self.orders_canceled += len(canceled)
+            
+            logger.info("dry_run_orders_canceled", count=len(canceled))
+            return canceled
+        
+        try:
+            response = self.client.cancel_orders(order_ids)
+        except Exception as e:
+            logger.error(
+                "cancel_orders_error",
+                count=len(order_ids),
+                error=str(e)
+            )
+            return []
+        
+        canceled = response.get("canceled", []) if isinstance(response, dict) else []
+        for order_id in canceled:
+            self.active_orders.pop(order_id, None)
+        self.orders_canceled += len(canceled)
+        
+        logger.info(
+            "orders_canceled",
+            count=len(canceled),
+            requested=len(order_ids)
+        )
+        return canceled
+    
     async def cancel_all_orders(self) -> int:
         """
         Cancel all active orders.
@@ -18,7 +18,7 @@ IMPORTANT:
 import asyncio
 import signal
 import sys
-from decimal import Decimal
+import time
 from datetime import datetime, timezone
 from typing import Optional
 import os
@@ -37,10 +37,11 @@ from py_clob_client.client import ClobClient
 from src.utils.logger import configure_logging, get_logger
 from src.data.binance_feed import BinancePriceFeed
 from src.data.polymarket_feed import PolymarketFeed
+from src.data.orderbook import OrderBook
+from src.data.feed_process import PolymarketFeedProcess
 from src.data.market_discovery import (
     discover_15min_btc_markets,
-    parse_strike_from_question,
-    calculate_remaining_seconds
+    parse_strike_from_question
 )
 from src.strategy.fair_value import FairValueCalculator
 from src.strategy.latency_arb import OracleLatencyEngine
@@ -55,6 +56,12 @@ configure_logging(level=settings.log_level)
 logger = get_logger(__name__)
 
 
+def _write_console(text: str):
+    """Write a block of text to stdout in a single call."""
+    sys.stdout.write(text)
+    sys.stdout.flush()
+
+
 class PolymarketHFTBot:
     """
     Main bot orchestrator.
@@ -63,6 +70,13 @@ class PolymarketHFTBot:
     for trading Polymarket 15-minute BTC prediction markets.
     """
     
+    # Below this many seconds an order can't clear fees + round-trip
+    # latency before expiry, so the tick isn't evaluated at all
+    MIN_ACTIONABLE_REMAINING = 3.0
+    
+    # Below this many seconds new quotes couldn't round-trip either
+    MIN_QUOTE_REMAINING = 15
+    
     def __init__(self):
         """Initialize bot components."""
         self.dry_run = settings.dry_run
@@ -111,23 +125,35 @@ class PolymarketHFTBot:
         self.mm_engine = MarketMakerEngine(
             fair_value_calc=self.fair_calc,
             spread_bps=settings.spread_bps,
-            quote_size=Decimal(str(settings.quote_size)),
+            quote_size=settings.quote_size,
             max_inventory_imbalance=settings.max_inventory_imbalance,
             refresh_interval_ms=settings.quote_refresh_ms
         )
         
         # State
-        self.current_binance_price: Decimal = Decimal("0")
+        self.current_binance_price: float = 0.0
         self.last_binance_update_ms: int = 0
         self.active_market: Optional[dict] = None
+        self._active_strike: Optional[float] = None
+        self._active_end_ns: int = 0  # market close on the monotonic clock
         self.running = False
         
         # Feeds
         self.binance_feed: Optional[BinancePriceFeed] = None
-        self.polymarket_feed: Optional[PolymarketFeed] = None
+        self.polymarket_feed: Optional[PolymarketFeed] = None  # or PolymarketFeedProcess
         
-        # Local orderbook cache
-        self.current_orderbook: Optional[dict] = None
+        # Local orderbook cache (SoA arrays, refilled in place)
+        self.current_orderbook = OrderBook()
+        
+        # Latest Binance tick lives in current_binance_price /
+        # last_binance_update_ms; the sequence number tells the strategy
+        # worker a new one arrived (single slot, nothing allocated per tick)
+        self._tick_seq: int = 0
+        self._tick_event = asyncio.Event()
+        
+        # Set by signal handlers; run() tears everything down when it fires
+        self._stop_event = asyncio.Event()
+        self._shutdown_done = False
     
     def _init_polymarket_client(self):
         """Initialize the Polymarket CLOB client."""
@@ -163,33 +189,67 @@ class PolymarketHFTBot:
             # Fall back to read-only client
             self.clob_client = ClobClient(host=settings.polymarket_host)
     
-    async def on_binance_price(self, price: Decimal, timestamp_ms: int):
+    async def on_binance_price(self, price: float, timestamp_ms: int):
         """
         Callback for Binance price updates.
         
-        This is where the main strategy logic runs.
+        Only records the tick and wakes the strategy worker, so the
+        Binance reader goes straight back to draining its socket.
         """
         self.current_binance_price = price
         self.last_binance_update_ms = timestamp_ms
+        self._tick_seq += 1
+        self._tick_event.set()
+    
+    async def _strategy_worker(self):
+        """
+        Run the strategy on the most recent Binance tick.
+        
+        Ticks that arrive while a previous evaluation is still running are
+        collapsed into the newest one: the worker reads the latest-tick
+        fields directly and uses _tick_seq to tell whether they changed.
+        """
+        seen = self._tick_seq
+        while self.running:
+            await self._tick_event.wait()
+            self._tick_event.clear()
+            
+            if self._tick_seq == seen:
+                continue
+            seen = self._tick_seq
+            price = self.current_binance_price
+            timestamp_ms = self.last_binance_update_ms
+            
+            try:
+                await self._on_tick(price, timestamp_ms)
+            except Exception as e:
+                logger.error("strategy_tick_error", error=str(e))
+    
+    async def _on_tick(self, price: float, timestamp_ms: int):
+        """
+        Evaluate one Binance tick.
         
+        This is where the main strategy logic runs.
+        """
         if not self.active_market or not self.current_orderbook:
             return
         
-        # Parse market data
-        strike = parse_strike_from_question(self.active_market["question"])
+        # Strike and close time are parsed once per market
+        strike = self._active_strike
         if not strike:
             return
         
-        strike_decimal = Decimal(str(strike))
-        
         # Calculate remaining time
-        remaining = calculate_remaining_seconds(self.active_market["end_date"])
+        remaining = max(0, (self._active_end_ns - time.monotonic_ns()) // 1_000_000_000)
         
         if remaining <= 0:
             # Market closed - discover new one
             await self._discover_new_market()
             return
         
+        if remaining < self.MIN_ACTIONABLE_REMAINING:
+            return
+        
         # =========================================
         # STRATEGY 1: Oracle Latency Arbitrage
         # =========================================
@@ -197,8 +257,8 @@ class PolymarketHFTBot:
         opportunity = None
         if settings.strategy_type in ["hybrid", "taker_only"]:
             opportunity = self.latency_engine.evaluate_opportunity(
-                binance_price=self.current_binance_price,
-                strike_price=strike_decimal,
+                binance_price=price,
+                strike_price=strike,
                 remaining_seconds=remaining,
                 orderbook=self.current_orderbook,
                 market_question=self.active_market["question"]
@@ -238,39 +298,40 @@ class PolymarketHFTBot:
         # =========================================
         # Only run if mode is 'hybrid' or 'maker_only'
         # AND if no latency opportunity was taken (to avoid conflicts)
-        if not opportunity and settings.strategy_type in ["hybrid", "maker_only"]:
+        if (
+            not opportunity
+            and remaining >= self.MIN_QUOTE_REMAINING
+            and settings.strategy_type in ["hybrid", "maker_only"]
+        ):
             # Token ID (Handle UP/YES mapping)
             token_id = self.active_market["tokens"].get("yes") or self.active_market["tokens"].get("up")
             
             if token_id:
                 orders_to_cancel, new_quotes = self.mm_engine.generate_quote_update(
-                    binance_price=self.current_binance_price,
-                    strike_price=strike_decimal,
+                    binance_price=price,
+                    strike_price=strike,
                     remaining_seconds=remaining,
                     orderbook=self.current_orderbook,
                     token_id=token_id
                 )
-            
-            # Cancel stale orders
-            for order_id in orders_to_cancel:
-                await self.order_manager.cancel_order(order_id)
-                self.mm_engine.record_order_canceled(order_id)
-            
-            # Place new quotes
-            for quote in new_quotes:
-                result = await self.order_manager.place_limit_order(
-                    token_id=quote.token_id,
-                    side=quote.side,
-                    price=float(quote.price),
-                    size=float(quote.size)
-                )
                 
-                if result.get("success"):
-                    self.mm_engine.record_order_placed(result["order_id"])
+                # Cancel stale orders (one batch request)
+                if orders_to_cancel:
+                    canceled = await self.order_manager.cancel_orders_batch(
+                        orders_to_cancel
+                    )
+                    for order_id in canceled:
+                        self.mm_engine.record_order_canceled(order_id)
+                
+                # Place new quotes (one batch request)
+                results = await self.order_manager.place_limit_orders_batch(new_quotes)
+                for result in results:
+                    if result.get("success"):
+                        self.mm_engine.record_order_placed(result["order_id"])
     
     async def on_orderbook_update(self, token_id: str, orderbook: dict):
         """Callback for Polymarket orderbook updates."""
-        self.current_orderbook = orderbook
+        self.current_orderbook.load(orderbook)
     
     async def _discover_new_market(self):
         """Discover a new active 15-minute BTC market."""
@@ -281,6 +342,7 @@ class PolymarketHFTBot:
             
             if markets:
                 self.active_market = markets[0]
+                self._cache_market_fields()
                 
                 logger.info(
                     "new_market_found",
@@ -295,12 +357,34 @@ class PolymarketHFTBot:
             else:
                 logger.warning("no_active_markets_found")
                 self.active_market = None
+                self._cache_market_fields()
                 
         except Exception as e:
             logger.error("market_discovery_error", error=str(e))
     
-    def _print_startup_banner(self):
-        """Print startup banner with configuration."""
+    def _cache_market_fields(self):
+        """Parse strike and end time of the active market once."""
+        market = self.active_market
+        if not market:
+            self._active_strike = None
+            self._active_end_ns = 0
+            return
+        
+        self._active_strike = parse_strike_from_question(market["question"])
+        
+        try:
+            end_dt = datetime.fromisoformat(
+                market["end_date"].replace("Z", "+00:00")
+            )
+            # Convert the wall-clock close to a monotonic deadline once;
+            # per-tick remaining time is then one integer subtraction
+            end_unix_ns = int(end_dt.timestamp() * 1e9)
+            self._active_end_ns = end_unix_ns - time.time_ns() + time.monotonic_ns()
+        except (ValueError, TypeError, AttributeError):
+            self._active_end_ns = 0
+    
+    def _format_startup_banner(self) -> str:
+        """Build startup banner with configuration."""
         fee_table = self.fee_calc.format_fee_table()
         
         banner = f"""
@@ -318,35 +402,42 @@ class PolymarketHFTBot:
 {fee_table}
 ╚══════════════════════════════════════════════════════════════════╝
 """
-        print(banner)
+        return banner + "\n"
+    
+    def _format_stats(self) -> str:
+        """Build current statistics as one string."""
+        lines = [
+            "",
+            "=" * 60,
+            "CURRENT STATISTICS",
+            "=" * 60,
+        ]
+        
+        sections = (
+            ("📈 Latency Arbitrage:", self.latency_engine.get_stats()),
+            ("💹 Market Making:", self.mm_engine.get_stats()),
+            ("⚠️ Risk Manager:", self.risk_manager.get_risk_summary()),
+            ("📝 Order Manager:", self.order_manager.get_stats()),
+        )
+        for title, stats in sections:
+            lines.append("")
+            lines.append(title)
+            lines.extend(f"   {k}: {v}" for k, v in stats.items())
+        
+        lines.append("=" * 60)
+        lines.append("")
+        return "\n".join(lines) + "\n"
     
     def _print_stats(self):
         """Print current statistics."""
-        print("\n" + "=" * 60)
-        print("CURRENT STATISTICS")
-        print("=" * 60)
-        
-        print("\n📈 Latency Arbitrage:")
-        for k, v in self.latency_engine.get_stats().items():
-            print(f"   {k}: {v}")
-        
-        print("\n💹 Market Making:")
-        for k, v in self.mm_engine.get_stats().items():
-            print(f"   {k}: {v}")
-        
-        print("\n⚠️ Risk Manager:")
-        for k, v in self.risk_manager.get_risk_summary().items():
-            print(f"   {k}: {v}")
-        
-        print("\n📝 Order Manager:")
-        for k, v in self.order_manager.get_stats().items():
-            print(f"   {k}: {v}")
-        
-        print("=" * 60 + "\n")
+        _write_console(self._format_stats())
     
     async def run(self):
         """Main bot execution loop."""
-        self._print_startup_banner()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, _write_console, self._format_startup_banner()
+        )
         
         self.running = True
         
@@ -364,37 +455,40 @@ class PolymarketHFTBot:
         )
         
         self.polymarket_feed = None
-        polymarket_task = None
         
         # Only connect to Polymarket WebSocket if we need order book data
         # In maker_only mode, we don't need it (paper trading uses Gamma API)
         if settings.strategy_type != "maker_only":
-            self.polymarket_feed = PolymarketFeed(
-                on_orderbook_update=self.on_orderbook_update,
-                wss_url=settings.polymarket_ws
-            )
+            if settings.polymarket_feed_process:
+                # Child process refills current_orderbook via shared memory
+                self.polymarket_feed = PolymarketFeedProcess(
+                    orderbook=self.current_orderbook,
+                    wss_url=settings.polymarket_ws
+                )
+            else:
+                self.polymarket_feed = PolymarketFeed(
+                    on_orderbook_update=self.on_orderbook_update,
+                    wss_url=settings.polymarket_ws
+                )
             
             # Subscribe to active market
             token_id = self.active_market["tokens"].get("yes") or self.active_market["tokens"].get("up")
             if self.polymarket_feed and token_id:
                 await self.polymarket_feed.subscribe(token_id)
             
-            polymarket_task = asyncio.create_task(self.polymarket_feed.connect())
             logger.info("polymarket_ws_enabled", strategy_type=settings.strategy_type)
         else:
             logger.info("polymarket_ws_disabled", reason="maker_only mode uses Gamma API")
         
-        # Start feed tasks
-        binance_task = asyncio.create_task(self.binance_feed.connect())
-        
         # Stats printing task
         async def print_stats_periodically():
             while self.running:
                 await asyncio.sleep(60)  # Print every minute
                 if self.running:
-                    self._print_stats()
-        
-        stats_task = asyncio.create_task(print_stats_periodically())
+                    # Snapshot on the loop, write to stdout off it
+                    await loop.run_in_executor(
+                        None, _write_console, self._format_stats()
+                    )
         
         # Market refresh task
         async def refresh_market_periodically():
@@ -403,8 +497,6 @@ class PolymarketHFTBot:
                 if self.running:
                     await self._discover_new_market()
         
-        refresh_task = asyncio.create_task(refresh_market_periodically())
-        
         # Volatility update task
         async def update_volatility_periodically():
             while self.running:
@@ -417,25 +509,46 @@ class PolymarketHFTBot:
                 
                 await asyncio.sleep(3600)  # Update every hour
         
-        vol_task = asyncio.create_task(update_volatility_periodically())
-        
         try:
-            # Run until stopped
-            tasks = [binance_task, stats_task, refresh_task, vol_task]
-            if polymarket_task:
-                tasks.append(polymarket_task)
-            await asyncio.gather(*tasks)
-        except asyncio.CancelledError:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [
+                    tg.create_task(self.binance_feed.connect()),
+                    tg.create_task(self._strategy_worker()),
+                    tg.create_task(print_stats_periodically()),
+                    tg.create_task(refresh_market_periodically()),
+                    tg.create_task(update_volatility_periodically()),
+                ]
+                if self.polymarket_feed:
+                    tasks.append(tg.create_task(self.polymarket_feed.connect()))
+                
+                # Run until stopped
+                await self._stop_event.wait()
+                
+                # Pull resting orders while everything is still up,
+                # then cancel the remaining tasks and let the group join them
+                await self.shutdown()
+                for task in tasks:
+                    task.cancel()
+            
             logger.info("bot_tasks_cancelled")
         finally:
             self.running = False
             self._print_stats()
     
+    def request_stop(self):
+        """Ask run() to shut down (safe to call from a signal handler)."""
+        self._stop_event.set()
+    
     async def shutdown(self):
         """Graceful shutdown."""
+        if self._shutdown_done:
+            return
+        self._shutdown_done = True
+        
         logger.info("bot_shutting_down")
         
         self.running = False
+        self._tick_event.set()  # wake the strategy worker so it exits
         
         # Cancel all orders
         await self.order_manager.cancel_all_orders()
@@ -454,11 +567,11 @@ async def main():
     bot = PolymarketHFTBot()
     
     # Setup signal handlers
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     
     def signal_handler():
         logger.info("shutdown_signal_received")
-        asyncio.create_task(bot.shutdown())
+        bot.request_stop()
     
     if sys.platform != "win32":
         for sig in (signal.SIGINT, signal.SIGTERM):
@@ -476,14 +589,15 @@ async def main():
 
 
 if __name__ == "__main__":
-    # Optimize event loop on non-Windows systems
+    # uvloop is mandatory on non-Windows systems: running the feeds on the
+    # default selector loop silently costs latency, so refuse to start.
     if sys.platform != "win32":
         try:
             import uvloop
-            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
-            print("🚀 uvloop active: HFT mode enabled for Linux/Mac")
         except ImportError:
-            pass
+            sys.exit("uvloop is required on Linux/Mac: pip install uvloop")
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        print("🚀 uvloop active: HFT mode enabled for Linux/Mac")
 
     print("\n🚀 Starting Polymarket HFT Bot...\n")
     asyncio.run(main())
@@ -8,12 +8,16 @@ CRITICAL: These fees were introduced in January 2026 and make
 simple arbitrage strategies unprofitable!
 """
 
-from decimal import Decimal
 from typing import Tuple
+import numpy as np
 import structlog
 
 logger = structlog.get_logger()
 
+# Side codes for edge_after_fees (int compare instead of "BUY" string compare)
+SIDE_YES = 1
+SIDE_NO = 0
+
 
 class DynamicFeeCalculator:
     """
@@ -41,6 +45,15 @@ class DynamicFeeCalculator:
         self.max_fee_bps = max_fee_bps
         self._calculations = 0
         
+        # Fee rate at every cent price (index = price in cents, 0..100).
+        # Prices trade on a 0.01 grid, so lookups replace the curve math.
+        cents = np.arange(101, dtype=np.float64) / 100
+        self._fee_table = (max_fee_bps / 10000) * 4 * cents * (1 - cents)
+        self._fee_list = self._fee_table.tolist()  # plain floats for scalar lookups
+        
+        # max_fee_bps is fixed per instance, so the display table is too
+        self._fee_table_str = self._build_fee_table()
+        
         # SAFETY CHECK: Warn user to verify fees
         logger.warning(
             "fee_structure_check",
@@ -48,10 +61,18 @@ class DynamicFeeCalculator:
             max_fee_bps=max_fee_bps
         )
     
-    def calculate_taker_fee(self, price: Decimal) -> float:
+    @property
+    def fee_table(self) -> np.ndarray:
+        """Fee rate per cent of price (index 0..100), float64."""
+        return self._fee_table
+    
+    def calculate_taker_fee(self, price: float) -> float:
         """
         Calculate taker fee rate at a given price.
         
+        Parabolic fee curve: fee = max_fee × 4 × p × (1-p), read from the
+        precomputed table at the nearest cent. Prices outside 0-1 pay 0.
+        
         Args:
             price: Share price (0.00 - 1.00)
         
@@ -60,22 +81,33 @@ class DynamicFeeCalculator:
         """
         self._calculations += 1
         
-        p = float(price)
+        idx = int(round(float(price) * 100))
+        if 0 <= idx <= 100:
+            return self._fee_list[idx]
+        return 0.0
+    
+    def calculate_taker_fee_batch(self, prices: np.ndarray) -> np.ndarray:
+        """
+        Vectorized calculate_taker_fee for an array of prices.
         
-        # Parabolic fee curve
-        # Maximum at p=0.5, minimum at p=0 or p=1
-        # fee = max_fee × 4 × p × (1-p)
-        fee_multiplier = 4 * p * (1 - p)
+        Args:
+            prices: Share prices (0.00 - 1.00)
+        
+        Returns:
+            Fee rates, same shape as prices
+        """
+        idx = np.rint(np.asarray(prices, dtype=np.float64) * 100).astype(np.intp)
+        np.clip(idx, 0, 100, out=idx)
         
-        fee_rate = (self.max_fee_bps / 10000) * fee_multiplier
+        self._calculations += idx.size
         
-        return max(0.0, fee_rate)
+        return self._fee_table[idx]
     
     def calculate_effective_cost(
         self,
-        price: Decimal,
-        size: Decimal
-    ) -> Tuple[Decimal, Decimal]:
+        price: float,
+        size: float
+    ) -> Tuple[float, float]:
         """
         Calculate total cost including fees.
         
@@ -89,12 +121,12 @@ class DynamicFeeCalculator:
         fee_rate = self.calculate_taker_fee(price)
         
         base_cost = price * size
-        fee_amount = base_cost * Decimal(str(fee_rate))
+        fee_amount = base_cost * fee_rate
         total_cost = base_cost + fee_amount
         
         return (total_cost, fee_amount)
     
-    def calculate_breakeven_edge(self, price: Decimal) -> float:
+    def calculate_breakeven_edge(self, price: float) -> float:
         """
         Calculate minimum edge needed to break even at this price.
         
@@ -116,7 +148,7 @@ class DynamicFeeCalculator:
     
     def is_profitable_entry(
         self,
-        price: Decimal,
+        price: float,
         fair_value: float,
         side: str = "BUY"
     ) -> Tuple[bool, float]:
@@ -131,22 +163,73 @@ class DynamicFeeCalculator:
         Returns:
             (is_profitable, expected_profit)
         """
-        fee_rate = self.calculate_taker_fee(price)
+        expected_profit = self.edge_after_fees(
+            price, fair_value, SIDE_YES if side == "BUY" else SIDE_NO
+        )
         
-        entry_cost = float(price) * (1 + fee_rate)
+        return (expected_profit > 0, expected_profit)
+    
+    def edge_after_fees(
+        self,
+        price_f: float,
+        fair_value: float,
+        side: int
+    ) -> float:
+        """
+        Expected profit per share after taker fees, in one pass.
         
-        if side == "BUY":
-            # Buying YES: payout is $1 if YES wins (prob = fair_value)
-            expected_value = fair_value * 1.0
-        else:
-            # Buying NO: payout is $1 if NO wins (prob = 1 - fair_value)
-            expected_value = (1 - fair_value) * 1.0
+        Hot-path form of is_profitable_entry: one fee lookup, no tuple,
+        no string compare. Callers test the result against their min edge.
         
-        expected_profit = expected_value - entry_cost
+        Args:
+            price_f: Entry price of the token being bought
+            fair_value: Our calculated fair probability that YES wins
+            side: SIDE_YES (payout if YES wins) or SIDE_NO
         
-        return (expected_profit > 0, expected_profit)
+        Returns:
+            Expected value minus fee-inclusive entry cost
+        """
+        self._calculations += 1
+        
+        idx = int(round(price_f * 100))
+        fee_rate = self._fee_list[idx] if 0 <= idx <= 100 else 0.0
+        
+        expected_value = fair_value if side == SIDE_YES else 1.0 - fair_value
+        
+        return expected_value - price_f * (1.0 + fee_rate)
+    
+    def edge_after_fees_batch(
+        self,
+        prices: np.ndarray,
+        fair_value: float,
+        side: int
+    ) -> np.ndarray:
+        """
+        Vectorized edge_after_fees over a ladder of entry prices.
+        
+        Lets a caller check every ask level of a book against one fair
+        value in a single pass (e.g. how deep the stale liquidity goes).
+        
+        Args:
+            prices: Entry prices of the token being bought
+            fair_value: Our calculated fair probability that YES wins
+            side: SIDE_YES or SIDE_NO
+        
+        Returns:
+            Expected profit per share at each price
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        fee_rates = self.calculate_taker_fee_batch(prices)
+        
+        expected_value = fair_value if side == SIDE_YES else 1.0 - fair_value
+        
+        return expected_value - prices * (1.0 + fee_rates)
     
     def format_fee_table(self) -> str:
+        """Return the fee table for display (built once in __init__)."""
+        return self._fee_table_str
+    
+    def _build_fee_table(self) -> str:
         """Generate a fee table for display."""
         lines = [
             "Polymarket 15-Min Market Fee Table",
@@ -156,9 +239,9 @@ class DynamicFeeCalculator:
         ]
         
         for price_cents in [5, 10, 20, 30, 40, 50, 60, 70, 80, 90, 95]:
-            price = Decimal(str(price_cents / 100))
-            fee_rate = self.calculate_taker_fee(price)
-            fee_on_100 = 100 * float(price) * fee_rate
+            price = price_cents / 100
+            fee_rate = self._fee_list[price_cents]
+            fee_on_100 = 100 * price * fee_rate
             
             lines.append(
                 f"${price_cents/100:>8.2f} | "
@@ -5,13 +5,35 @@ Risk Manager
 Enforces risk limits and validates all trades before execution.
 """
 
+import time
 from decimal import Decimal
 from typing import Tuple
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 import structlog
 
 logger = structlog.get_logger()
 
+# Shared approve result (no tuple built per approved trade)
+_OK = (True, "OK")
+
+# validate_trade reject bits, in check priority order (lowest set bit wins)
+_REJECT_TRADE_SIZE = 1 << 0
+_REJECT_POSITION_SIZE = 1 << 1
+_REJECT_DAILY_LOSS = 1 << 2
+_REJECT_MAX_POSITIONS = 1 << 3
+_REJECT_PRICE = 1 << 4
+_REJECT_SIZE = 1 << 5
+
+# Reject reasons, only formatted once a trade is actually rejected
+_REJECT_MESSAGES = {
+    _REJECT_TRADE_SIZE: "Trade too large: ${total_cost:.2f} > ${max_trade:.2f}",
+    _REJECT_POSITION_SIZE: "Position too large: ${total_cost:.2f} > ${max_position:.2f}",
+    _REJECT_DAILY_LOSS: "Daily loss limit reached: ${daily_loss:.2f}",
+    _REJECT_MAX_POSITIONS: "Max positions reached: {open_positions}/{max_positions}",
+    _REJECT_PRICE: "Suspicious price: {price}",
+    _REJECT_SIZE: "Invalid size: {size}",
+}
+
 
 class RiskManager:
     """
@@ -44,9 +66,11 @@ class RiskManager:
         self.max_position = max_position_usd
         self.max_positions = max_open_positions
         self.max_trade = max_single_trade_usd
+        self._neg_max_loss = -max_daily_loss_usd
         
         # Daily tracking
         self._current_date: date = date.today()
+        self._next_reset_at: float = self._next_midnight(self._current_date)
         self.daily_pnl: float = 0.0
         self.daily_trades: int = 0
         
@@ -66,9 +90,19 @@ class RiskManager:
         self.max_consecutive_losses = 3
         self.max_drawdown_pct = 0.10 # 10% max drawdown
     
+    @staticmethod
+    def _next_midnight(day: date) -> float:
+        """Unix time of the local midnight that ends `day`."""
+        return datetime.combine(day + timedelta(days=1), datetime.min.time()).timestamp()
+    
     def _reset_daily_if_needed(self):
         """Reset daily counters if it's a new day."""
+        # One float compare per call; the date is only looked up after midnight
+        if time.time() < self._next_reset_at:
+            return
+        
         today = date.today()
+        self._next_reset_at = self._next_midnight(today)
         if today != self._current_date:
             logger.info(
                 "risk_daily_reset",
@@ -89,7 +123,8 @@ class RiskManager:
         price: float,
         size: float,
         fee_rate: float,
-        side: str = "BUY"
+        side: str = "BUY",
+        pending_positions: int = 0
     ) -> Tuple[bool, str]:
         """
         Validate a trade against risk limits.
@@ -99,6 +134,8 @@ class RiskManager:
             size: Number of shares
             fee_rate: Expected fee rate
             side: "BUY" or "SELL"
+            pending_positions: Positions approved but not yet recorded
+                (e.g. earlier BUYs in the same order batch)
         
         Returns:
             (is_valid, reason) - reason explains rejection if not valid
@@ -111,51 +148,44 @@ class RiskManager:
             return (False, f"Trading halted: {self.halt_reason}")
         
         total_cost = price * size * (1 + fee_rate)
+        open_positions = self.open_positions + pending_positions
         
-        # 1. Maximum trade size
-        if total_cost > self.max_trade:
-            self.trades_rejected += 1
-            return (
-                False,
-                f"Trade too large: ${total_cost:.2f} > ${self.max_trade:.2f}"
-            )
-        
-        # 2. Maximum position size
-        if total_cost > self.max_position:
-            self.trades_rejected += 1
-            return (
-                False,
-                f"Position too large: ${total_cost:.2f} > ${self.max_position:.2f}"
-            )
+        # All six checks folded into one bitmask:
+        # 1. trade size, 2. position size, 3. daily loss,
+        # 4. open positions, 5. price sanity, 6. size sanity
+        flags = (
+            (total_cost > self.max_trade)
+            | (total_cost > self.max_position) << 1
+            | (self.daily_pnl < self._neg_max_loss) << 2
+            | (side == "BUY" and open_positions >= self.max_positions) << 3
+            | (price > 0.99 or price < 0.01) << 4
+            | (size <= 0 or size > 10000) << 5
+        )
         
-        # 3. Daily loss limit
-        if self.daily_pnl < -self.max_daily_loss:
-            self.is_halted = True
-            self.halt_reason = f"Daily loss limit reached: ${-self.daily_pnl:.2f}"
-            self.trades_rejected += 1
-            return (False, self.halt_reason)
+        if not flags:
+            self.trades_approved += 1
+            return _OK
         
-        # 4. Maximum open positions
-        if side == "BUY" and self.open_positions >= self.max_positions:
-            self.trades_rejected += 1
-            return (
-                False,
-                f"Max positions reached: {self.open_positions}/{self.max_positions}"
-            )
+        # Report the first failing check, as the sequential checks did
+        self.trades_rejected += 1
+        failed = flags & -flags
         
-        # 5. Price sanity check
-        if price > 0.99 or price < 0.01:
-            self.trades_rejected += 1
-            return (False, f"Suspicious price: {price}")
+        reason = _REJECT_MESSAGES[failed].format(
+            total_cost=total_cost,
+            max_trade=self.max_trade,
+            max_position=self.max_position,
+            daily_loss=-self.daily_pnl,
+            open_positions=open_positions,
+            max_positions=self.max_positions,
+            price=price,
+            size=size
+        )
         
-        # 6. Size sanity check
-        if size <= 0 or size > 10000:
-            self.trades_rejected += 1
-            return (False, f"Invalid size: {size}")
+        if failed == _REJECT_DAILY_LOSS:
+            self.is_halted = True
+            self.halt_reason = reason
         
-        # All checks passed
-        self.trades_approved += 1
-        return (True, "OK")
+        return (False, reason)
     
     def record_trade_opened(self, cost: float):
         """Record that a position was opened."""
@@ -7,13 +7,65 @@ using a simplified Black-Scholes-like model.
 """
 
 import math
-from decimal import Decimal
-from scipy.stats import norm
 from typing import Tuple
+import numpy as np
+from scipy.special import ndtr
 import structlog
 
+from src.utils.jit import njit
+
 logger = structlog.get_logger()
 
+# Seconds -> years, as a multiplier
+_SEC_PER_YEAR = 1.0 / (365.25 * 24 * 60 * 60)
+_SQRT2 = math.sqrt(2.0)
+
+
+# Explicit signature: compiled at import, so the first tick doesn't pay
+# for JIT compilation (no-op without numba)
+@njit("float64(float64, float64, float64, float64)", cache=True, fastmath=True)
+def fair_prob_kernel(
+    S: float,
+    K: float,
+    remaining_seconds: float,
+    annual_vol: float
+) -> float:
+    """
+    P(BTC > Strike at expiry), clipped to [0.01, 0.99].
+    
+    Pure-float core of FairValueCalculator.calculate_fair_probability,
+    with the normal CDF written via math.erf so Numba can compile it.
+    
+    Args:
+        S: Current spot price
+        K: Strike price
+        remaining_seconds: Seconds until market closes
+        annual_vol: Annualized volatility
+    
+    Returns:
+        Fair probability that YES wins (0.0 / 1.0 when already decided)
+    """
+    # Edge case: expired or about to expire
+    if remaining_seconds <= 0:
+        # Binary outcome - price already determined
+        return 1.0 if S > K else 0.0
+    
+    # Volatility scaled for time remaining (in years)
+    sigma_t = annual_vol * math.sqrt(remaining_seconds * _SEC_PER_YEAR)
+    
+    # Avoid division by zero
+    if sigma_t < 0.0001 or S <= 0:
+        return 1.0 if S > K else 0.0
+    
+    # d = ln(S/K) / (σ√T) for the log-normal model
+    d = math.log(S / K) / sigma_t if K > 0 else 0.0
+    
+    # Φ(d) = P(BTC > Strike)
+    probability = 0.5 * (1.0 + math.erf(d / _SQRT2))
+    
+    # Clip to reasonable bounds (never 0 or 1 exactly)
+    return max(0.01, min(0.99, probability))
+
 
 class FairValueCalculator:
     """
@@ -40,19 +92,23 @@ class FairValueCalculator:
         """
         self.annual_vol = annual_volatility
         self._calc_count = 0
+        
+        # Strike grid for calculate_fair_probability_grid (set_strike_grid)
+        self._grid_strikes = np.empty(0, dtype=np.float64)
+        self._grid_log_k = np.empty(0, dtype=np.float64)
     
     def calculate_fair_probability(
         self,
-        current_price: Decimal,
-        strike_price: Decimal,
+        current_price: float,
+        strike_price: float,
         remaining_seconds: int
     ) -> float:
         """
         Calculate fair probability that BTC will be above strike at expiry.
         
         Args:
-            current_price: Current BTC price (from Binance)
-            strike_price: Strike/target price from market
+            current_price: Current BTC price (from Binance), as float
+            strike_price: Strike/target price from market, as float
             remaining_seconds: Seconds until market closes
         
         Returns:
@@ -60,44 +116,120 @@ class FairValueCalculator:
         """
         self._calc_count += 1
         
-        # Edge case: expired or about to expire
-        if remaining_seconds <= 0:
-            # Binary outcome - price already determined
-            return 1.0 if current_price > strike_price else 0.0
+        # Float contract; anything else (e.g. Decimal) is coerced once here
+        return fair_prob_kernel(
+            float(current_price),
+            float(strike_price),
+            float(remaining_seconds),
+            self.annual_vol
+        )
+    
+    def calculate_fair_probability_batch(
+        self,
+        current_prices: np.ndarray,
+        strike_prices: np.ndarray,
+        remaining_seconds: np.ndarray
+    ) -> np.ndarray:
+        """
+        Vectorized calculate_fair_probability over many markets at once.
+        
+        One ndtr call over the whole array instead of one CDF per market.
+        Inputs broadcast against each other (e.g. one spot, many strikes).
+        
+        Args:
+            current_prices: Current BTC prices
+            strike_prices: Strike prices
+            remaining_seconds: Seconds until each market closes
+        
+        Returns:
+            Fair probabilities that YES wins, broadcast shape of the inputs
+        """
+        R = np.asarray(remaining_seconds, dtype=np.float64)
+        
+        # σ√T on the un-broadcast times: markets sharing an expiry clock
+        # (a scalar remaining_seconds) pay for one sqrt, not one per market
+        sigma_t = self.annual_vol * np.sqrt(np.maximum(R, 0.0) * _SEC_PER_YEAR)
+        
+        S, K, R, sigma_t = np.broadcast_arrays(
+            np.asarray(current_prices, dtype=np.float64),
+            np.asarray(strike_prices, dtype=np.float64),
+            R,
+            sigma_t
+        )
+        self._calc_count += S.size
+        
+        # Expired / zero-vol / bad spot: outcome already determined
+        decided = (R <= 0) | (sigma_t < 0.0001) | (S <= 0)
+        
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d = np.where(K > 0, np.log(S / K) / sigma_t, 0.0)
+        
+        probs = ndtr(d)
+        np.clip(probs, 0.01, 0.99, out=probs)
+        
+        return np.where(decided, (S > K).astype(np.float64), probs)
+    
+    def set_strike_grid(self, strikes) -> None:
+        """
+        Fix the strike grid used by calculate_fair_probability_grid.
+        
+        Strikes rarely change within a session, so ln(K) is computed once
+        here instead of on every tick.
         
-        # Convert to float for calculations
-        S = float(current_price)  # Current spot price
-        K = float(strike_price)   # Strike price
+        Args:
+            strikes: Strike prices (all > 0)
+        """
+        strikes = np.asarray(strikes, dtype=np.float64)
+        if np.any(strikes <= 0):
+            raise ValueError("strikes must be positive")
+        
+        self._grid_strikes = strikes
+        self._grid_log_k = np.log(strikes)
+    
+    def calculate_fair_probability_grid(
+        self,
+        current_price: float,
+        remaining_seconds: float
+    ) -> np.ndarray:
+        """
+        Fair probabilities for every strike on the grid, in float32.
         
-        # Time to expiry in years
-        T = remaining_seconds / (365.25 * 24 * 60 * 60)
+        Probabilities are clipped to [0.01, 0.99], so single precision is
+        plenty and doubles the SIMD width of the ndtr pass.
+        
+        Args:
+            current_price: Current BTC price
+            remaining_seconds: Seconds until the markets close
+        
+        Returns:
+            float32 probabilities that YES wins, one per grid strike
+        """
+        S = float(current_price)
+        strikes = self._grid_strikes
+        self._calc_count += strikes.size
         
-        # Volatility scaled for time period
-        sigma_t = self.annual_vol * math.sqrt(T)
+        sigma_t = self.annual_vol * math.sqrt(
+            max(remaining_seconds, 0.0) * _SEC_PER_YEAR
+        )
         
-        # Avoid division by zero
-        if sigma_t < 0.0001 or S <= 0:
-            return 1.0 if S > K else 0.0
+        # Expired / zero-vol / bad spot: outcome already determined
+        if remaining_seconds <= 0 or sigma_t < 0.0001 or S <= 0:
+            return (S > strikes).astype(np.float32)
         
-        # d = (ln(S/K)) / (σ√T) for log-normal model
-        # Simplified: (S - K) / (S × σ√T) for small T
-        try:
-            # Use log-normal for better accuracy
-            d = math.log(S / K) / sigma_t if K > 0 else 0
-            
-            # Φ(d) = P(BTC > Strike)
-            probability = norm.cdf(d)
-            
-        except (ValueError, ZeroDivisionError):
-            probability = 1.0 if S > K else 0.0
+        # d = (ln S - ln K) / σ√T, with ln K precomputed per strike. The
+        # difference is taken in float64 (ln S and ln K nearly cancel);
+        # only the CDF pass runs in float32.
+        d = math.log(S) - self._grid_log_k
+        d *= 1.0 / sigma_t
         
-        # Clip to reasonable bounds (never 0 or 1 exactly)
-        return max(0.01, min(0.99, probability))
+        probs = ndtr(d.astype(np.float32))
+        np.clip(probs, 0.01, 0.99, out=probs)
+        return probs
     
     def calculate_edge(
         self,
         fair_prob: float,
-        market_price: Decimal,
+        market_price: float,
         fee_rate: float = 0.03
     ) -> Tuple[float, str]:
         """
@@ -137,7 +269,7 @@ class FairValueCalculator:
     def is_mispriced(
         self,
         fair_prob: float,
-        market_price: Decimal,
+        market_price: float,
         fee_rate: float = 0.03,
         min_edge: float = 0.02
     ) -> Tuple[bool, str, float]:
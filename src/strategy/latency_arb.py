@@ -9,21 +9,90 @@ This is the "sniper" component of the hybrid strategy.
 """
 
 import asyncio
-from decimal import Decimal
+import time
 from dataclasses import dataclass
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from datetime import datetime
+import numpy as np
 import structlog
 
+from src.data.orderbook import OrderBook
+from src.risk.fee_calculator import SIDE_YES, SIDE_NO
+from src.strategy.fair_value import fair_prob_kernel
+from src.utils.jit import njit
+
 logger = structlog.get_logger()
 
+# evaluate_tick result when neither side clears the minimum edge
+NO_SIDE = -1
+
+# Edge of a side with no quote: finite (fastmath assumes no infinities)
+# and below any real edge, which lies in [-2, 1] for fees under 100%
+_NO_EDGE = -2.0
+
+
+@njit(cache=True, fastmath=True)
+def evaluate_tick(
+    binance_px: float,
+    strike: float,
+    remaining_s: float,
+    best_bid: float,
+    best_ask: float,
+    fee_table: np.ndarray,
+    annual_vol: float,
+    min_edge: float
+) -> Tuple[int, float, float, float]:
+    """
+    Numeric core of a snipe evaluation (pure float, Numba-compilable).
+    
+    Same math as FairValueCalculator.calculate_fair_probability followed by
+    DynamicFeeCalculator.edge_after_fees on the YES ask and on the NO
+    price implied by the YES bid, fused into one pass; the better side wins.
+    
+    Args:
+        binance_px: Current BTC price
+        strike: Market strike price
+        remaining_s: Seconds until market close
+        best_bid: Best YES bid (pass 0.0 if none)
+        best_ask: Best YES ask (pass 0.0 if none)
+        fee_table: Taker fee rate per cent of price (101 entries)
+        annual_vol: Annualized volatility
+        min_edge: Minimum edge after fees
+    
+    Returns:
+        (side, price, edge, fair_prob) with side SIDE_YES, SIDE_NO or NO_SIDE
+    """
+    # Fair probability that YES wins
+    fair_prob = fair_prob_kernel(binance_px, strike, remaining_s, annual_vol)
+    
+    # YES: buy the best ask
+    yes_edge = _NO_EDGE
+    if 0.0 < best_ask < 1.0:
+        fee_rate = fee_table[int(round(best_ask * 100))]
+        yes_edge = fair_prob - best_ask * (1.0 + fee_rate)
+    
+    # NO: implied from the best YES bid
+    no_price = 1.0 - best_bid
+    no_edge = _NO_EDGE
+    if 0.0 < best_bid < 1.0:
+        fee_rate = fee_table[int(round(no_price * 100))]
+        no_edge = (1.0 - fair_prob) - no_price * (1.0 + fee_rate)
+    
+    if yes_edge >= no_edge:
+        if yes_edge >= min_edge:
+            return SIDE_YES, best_ask, yes_edge, fair_prob
+    elif no_edge >= min_edge:
+        return SIDE_NO, no_price, no_edge, fair_prob
+    
+    return NO_SIDE, 0.0, 0.0, fair_prob
+
 
 @dataclass
 class SniperOpportunity:
     """Represents a detected arbitrage opportunity."""
     token_id: str
     side: str  # "YES" or "NO"
-    stale_price: Decimal
+    stale_price: float
     fair_price: float
     expected_profit: float
     market_question: str
@@ -44,6 +113,10 @@ class OracleLatencyEngine:
     our direct Binance feed, creating brief arbitrage windows.
     """
     
+    # Log 1-in-N opportunities (the first always): a stale book re-reports
+    # the same opportunity on every tick until it is taken or repriced
+    OPPORTUNITY_LOG_EVERY = 10
+    
     def __init__(
         self,
         fair_value_calc,
@@ -67,7 +140,7 @@ class OracleLatencyEngine:
         self.cooldown = cooldown_seconds
         
         # State
-        self.last_snipe_time: Optional[datetime] = None
+        self._next_allowed_monotonic = 0.0  # time.monotonic() cooldown deadline
         
         # Stats
         self.opportunities_found = 0
@@ -76,10 +149,10 @@ class OracleLatencyEngine:
     
     def evaluate_opportunity(
         self,
-        binance_price: Decimal,
-        strike_price: Decimal,
+        binance_price: float,
+        strike_price: float,
         remaining_seconds: int,
-        orderbook: dict,
+        orderbook: OrderBook,
         market_question: str = ""
     ) -> Optional[SniperOpportunity]:
         """
@@ -89,154 +162,149 @@ class OracleLatencyEngine:
             binance_price: Current BTC price from Binance
             strike_price: Market's strike price
             remaining_seconds: Time until market closes
-            orderbook: {"bids": [...], "asks": [...], "token_id": ...}
+            orderbook: OrderBook with SoA bid/ask arrays
             market_question: Market question for logging
         
         Returns:
             SniperOpportunity if profitable, None otherwise
         """
-        # Cooldown check
-        if self.last_snipe_time:
-            elapsed = (datetime.now() - self.last_snipe_time).total_seconds()
-            if elapsed < self.cooldown:
-                return None
-        
-        # Don't trade if market is about to close (< 30 seconds)
-        if remaining_seconds < 30:
+        # Cooldown (monotonic deadline) or market about to close (< 30s)
+        if remaining_seconds < 30 or time.monotonic() < self._next_allowed_monotonic:
             return None
         
-        # Calculate fair value
-        fair_prob = self.fair_calc.calculate_fair_probability(
-            binance_price, strike_price, remaining_seconds
-        )
-        
-        token_id = orderbook.get("token_id", "")
+        best_bid = orderbook.best_bid()
+        best_ask = orderbook.best_ask()
         
-        # Check YES side (buy the ask)
-        yes_opp = self._check_yes_opportunity(
-            fair_prob, orderbook, token_id, market_question
+        # Fair value + YES/NO edge checks in one compiled call
+        side, price, edge, fair_prob = evaluate_tick(
+            float(binance_price),
+            float(strike_price),
+            float(remaining_seconds),
+            0.0 if best_bid is None else best_bid,
+            0.0 if best_ask is None else best_ask,
+            self.fee_calc.fee_table,
+            self.fair_calc.annual_vol,
+            self.min_edge
         )
-        if yes_opp:
-            return yes_opp
         
-        # Check NO side (need to look at NO token's book or infer from YES bids)
-        no_opp = self._check_no_opportunity(
-            fair_prob, orderbook, token_id, market_question
-        )
-        if no_opp:
-            return no_opp
+        if side == NO_SIDE:
+            return None
         
-        return None
+        return self._build_opportunity(
+            side, price, edge, fair_prob, orderbook.token_id, market_question
+        )
     
-    def _check_yes_opportunity(
+    def evaluate_all(
         self,
-        fair_prob: float,
-        orderbook: dict,
-        token_id: str,
-        market_question: str
-    ) -> Optional[SniperOpportunity]:
-        """Check if buying YES is profitable."""
-        asks = orderbook.get("asks", [])
-        if not asks:
-            return None
+        binance_price: float,
+        strike_prices: np.ndarray,
+        remaining_seconds: np.ndarray,
+        best_bids: np.ndarray,
+        best_asks: np.ndarray,
+        token_ids: List[str],
+        market_questions: Optional[List[str]] = None
+    ) -> List[SniperOpportunity]:
+        """
+        Evaluate a whole strike ladder against one Binance price.
         
-        # Get best ask (lowest price to buy YES)
-        best_ask = min(asks, key=lambda x: float(x.get("price", 999)))
-        ask_price = Decimal(str(best_ask.get("price", 0)))
+        Same decision as evaluate_opportunity per market, but fair values,
+        fees and edges are computed as array ops (one ndtr call for the
+        ladder) instead of one kernel call per market.
         
-        if ask_price <= 0 or ask_price >= 1:
-            return None
+        Args:
+            binance_price: Current BTC price from Binance
+            strike_prices: Strike per market
+            remaining_seconds: Seconds until each market closes
+            best_bids: Best YES bid per market (0.0 if none)
+            best_asks: Best YES ask per market (0.0 if none)
+            token_ids: Token id per market
+            market_questions: Optional question per market for logging
         
-        # Calculate fee at this price
-        fee_rate = self.fee_calc.calculate_taker_fee(ask_price)
+        Returns:
+            Opportunities for every market that clears the minimum edge
+        """
+        if time.monotonic() < self._next_allowed_monotonic:
+            return []
         
-        # Calculate edge
-        effective_cost = float(ask_price) * (1 + fee_rate)
-        expected_payout = fair_prob * 1.0
-        edge = expected_payout - effective_cost
+        remaining = np.asarray(remaining_seconds, dtype=np.float64)
+        bids = np.asarray(best_bids, dtype=np.float64)
+        asks = np.asarray(best_asks, dtype=np.float64)
+        no_prices = 1.0 - bids
         
-        if edge >= self.min_edge:
-            self.opportunities_found += 1
-            
-            logger.info(
-                "snipe_opportunity_found",
-                side="YES",
-                fair_prob=f"{fair_prob:.4f}",
-                market_price=str(ask_price),
-                edge=f"{edge:.4f}",
-                fee_rate=f"{fee_rate:.4f}"
-            )
-            
-            return SniperOpportunity(
-                token_id=token_id,
-                side="YES",
-                stale_price=ask_price,
-                fair_price=fair_prob,
-                expected_profit=edge,
-                market_question=market_question,
-                timestamp=datetime.now()
-            )
+        probs = self.fair_calc.calculate_fair_probability_batch(
+            binance_price, strike_prices, remaining
+        )
+        
+        yes_edge = probs - asks * (
+            1.0 + self.fee_calc.calculate_taker_fee_batch(asks)
+        )
+        no_edge = (1.0 - probs) - no_prices * (
+            1.0 + self.fee_calc.calculate_taker_fee_batch(no_prices)
+        )
+        
+        # Missing sides can't be traded
+        yes_edge[(asks <= 0.0) | (asks >= 1.0)] = -np.inf
+        no_edge[(bids <= 0.0) | (bids >= 1.0)] = -np.inf
+        
+        take_yes = yes_edge >= no_edge
+        edges = np.where(take_yes, yes_edge, no_edge)
+        
+        # Don't trade markets about to close (< 30 seconds)
+        hits = np.flatnonzero((edges >= self.min_edge) & (remaining >= 30))
         
-        return None
+        return [
+            self._build_opportunity(
+                SIDE_YES if take_yes[i] else SIDE_NO,
+                float(asks[i] if take_yes[i] else no_prices[i]),
+                float(edges[i]),
+                float(probs[i]),
+                token_ids[i],
+                market_questions[i] if market_questions else ""
+            )
+            for i in hits
+        ]
     
-    def _check_no_opportunity(
+    def _build_opportunity(
         self,
+        side: int,
+        price: float,
+        edge: float,
         fair_prob: float,
-        orderbook: dict,
         token_id: str,
         market_question: str
-    ) -> Optional[SniperOpportunity]:
-        """Check if buying NO is profitable."""
-        # For NO, we look at implied NO price from YES bids
-        # If best YES bid is 0.60, then NO can be bought at ~0.40
-        bids = orderbook.get("bids", [])
-        if not bids:
-            return None
-        
-        # Get best bid for YES
-        best_bid = max(bids, key=lambda x: float(x.get("price", 0)))
-        yes_bid_price = float(best_bid.get("price", 0))
-        
-        if yes_bid_price <= 0 or yes_bid_price >= 1:
-            return None
-        
-        # Implied NO price (this is approximate)
-        no_price = Decimal(str(1.0 - yes_bid_price))
+    ) -> SniperOpportunity:
+        """Log (sampled) and package an opportunity found by evaluate_tick."""
+        self.opportunities_found += 1
         
-        # Calculate fee at NO price
-        fee_rate = self.fee_calc.calculate_taker_fee(no_price)
+        if side == SIDE_YES:
+            side_str = "YES"
+            side_prob = fair_prob
+        else:
+            # For NO the price is implied from the best YES bid
+            side_str = "NO"
+            side_prob = 1 - fair_prob
         
-        # NO fair probability
-        no_fair_prob = 1 - fair_prob
-        
-        # Calculate edge
-        effective_cost = float(no_price) * (1 + fee_rate)
-        expected_payout = no_fair_prob * 1.0
-        edge = expected_payout - effective_cost
-        
-        if edge >= self.min_edge:
-            self.opportunities_found += 1
-            
+        # Raw floats: formatting is left to the log renderer
+        if (self.opportunities_found - 1) % self.OPPORTUNITY_LOG_EVERY == 0:
             logger.info(
                 "snipe_opportunity_found",
-                side="NO",
-                fair_prob=f"{no_fair_prob:.4f}",
-                implied_price=str(no_price),
-                edge=f"{edge:.4f}",
-                fee_rate=f"{fee_rate:.4f}"
-            )
-            
-            return SniperOpportunity(
-                token_id=token_id,  # Note: This would need NO token ID
-                side="NO",
-                stale_price=no_price,
-                fair_price=no_fair_prob,
-                expected_profit=edge,
-                market_question=market_question,
-                timestamp=datetime.now()
+                side=side_str,
+                fair_prob=side_prob,
+                market_price=price,
+                edge=edge,
+                fee_rate=self.fee_calc.calculate_taker_fee(price),
+                found=self.opportunities_found
             )
         
-        return None
+        return SniperOpportunity(
+            token_id=token_id,  # Note: NO side would need the NO token ID
+            side=side_str,
+            stale_price=price,
+            fair_price=side_prob,
+            expected_profit=edge,
+            market_question=market_question,
+            timestamp=datetime.now()
+        )
     
     def calculate_position_size(
         self,
@@ -247,32 +315,29 @@ class OracleLatencyEngine:
         
         Uses Kelly criterion with safety factor.
         """
-        price = float(opportunity.stale_price)
+        price = opportunity.stale_price
+        inv_price = 1.0 / price if price > 0 else 0.0
         
         # Maximum shares we can buy
-        max_shares = self.max_position / price
+        max_shares = self.max_position * inv_price
         
-        # Kelly fraction (simplified)
-        # f* = (bp - q) / b where b = odds, p = win prob, q = lose prob
-        edge = opportunity.expected_profit
-        win_prob = opportunity.fair_price
-        
-        # Very conservative: use 25% Kelly
-        kelly_fraction = 0.25 * edge / price if price > 0 else 0
-        kelly_shares = kelly_fraction * self.max_position / price
+        # 25% Kelly: the fraction of bankroll is edge / price (return on
+        # cost), and that dollar amount buys another 1/price shares
+        kelly_shares = (
+            0.25 * opportunity.expected_profit * self.max_position
+            * inv_price * inv_price
+        )
         
-        # Take minimum of max and Kelly
+        # Take minimum of max and Kelly, clamped to [1, 100] shares
         shares = min(max_shares, kelly_shares)
-        
-        # Round to reasonable amount
-        return max(1.0, min(shares, 100.0))
+        return 1.0 if shares < 1.0 else (100.0 if shares > 100.0 else shares)
     
     def record_execution(self, success: bool, profit: float = 0.0):
         """Record execution result."""
         if success:
             self.opportunities_taken += 1
             self.total_profit += profit
-            self.last_snipe_time = datetime.now()
+            self._next_allowed_monotonic = time.monotonic() + self.cooldown
     
     def get_stats(self) -> dict:
         """Return strategy statistics."""
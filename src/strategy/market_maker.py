@@ -6,12 +6,13 @@ Provides liquidity and earns spread + maker rebates.
 This is the passive income component of the hybrid strategy.
 """
 
-from decimal import Decimal
 from dataclasses import dataclass
-from typing import Optional, List, Tuple
+from typing import Optional, List, Set, Tuple
 from datetime import datetime
 import structlog
 
+from src.data.orderbook import OrderBook
+
 logger = structlog.get_logger()
 
 
@@ -20,8 +21,8 @@ class Quote:
     """Represents a quote to be placed."""
     token_id: str
     side: str  # "BUY" or "SELL"
-    price: Decimal
-    size: Decimal
+    price: float
+    size: float
 
 
 class MarketMakerEngine:
@@ -42,7 +43,7 @@ class MarketMakerEngine:
         self,
         fair_value_calc,
         spread_bps: int = 50,          # 0.5% spread
-        quote_size: Decimal = Decimal("50"),
+        quote_size: float = 50.0,
         max_inventory_imbalance: float = 0.3,
         refresh_interval_ms: int = 1000
     ):
@@ -56,26 +57,26 @@ class MarketMakerEngine:
         """
         self.fair_calc = fair_value_calc
         self.spread_bps = spread_bps
-        self.base_quote_size = quote_size
+        self.base_quote_size = float(quote_size)
         self.max_imbalance = max_inventory_imbalance
         self.refresh_ms = refresh_interval_ms
         
         # Inventory tracking
-        self.yes_position: Decimal = Decimal("0")
-        self.no_position: Decimal = Decimal("0")
+        self.yes_position: float = 0.0
+        self.no_position: float = 0.0
         
         # Active orders tracking
-        self.active_orders: List[str] = []
+        self.active_orders: Set[str] = set()
         
         # Stats
         self.quotes_placed = 0
         self.fills_received = 0
-        self.rebates_earned = Decimal("0")
+        self.rebates_earned = 0.0
     
     def calculate_quotes(
         self,
         fair_price: float,
-        orderbook: dict,
+        orderbook: OrderBook,
         token_id: str
     ) -> Tuple[Optional[Quote], Optional[Quote]]:
         """
@@ -93,16 +94,14 @@ class MarketMakerEngine:
         """
         half_spread = self.spread_bps / 10000 / 2
         
-        # Quote prices
-        bid_price = Decimal(str(max(0.01, fair_price - half_spread)))
-        ask_price = Decimal(str(min(0.99, fair_price + half_spread)))
+        # Quote prices (float throughout; rounded only when packaged)
+        bid_price = max(0.01, fair_price - half_spread)
+        ask_price = min(0.99, fair_price + half_spread)
         
         # Calculate inventory imbalance
         total_inventory = self.yes_position + self.no_position
         if total_inventory > 0:
-            imbalance = float(
-                (self.yes_position - self.no_position) / total_inventory
-            )
+            imbalance = (self.yes_position - self.no_position) / total_inventory
         else:
             imbalance = 0.0
         
@@ -113,42 +112,42 @@ class MarketMakerEngine:
         if abs(imbalance) > self.max_imbalance:
             if imbalance > 0:
                 # Too much YES - reduce bid (buy less), increase ask (sell more)
-                bid_size = self.base_quote_size * Decimal("0.5")
-                ask_size = self.base_quote_size * Decimal("1.5")
+                bid_size = self.base_quote_size * 0.5
+                ask_size = self.base_quote_size * 1.5
             else:
                 # Too much NO - increase bid (buy more), reduce ask
-                bid_size = self.base_quote_size * Decimal("1.5")
-                ask_size = self.base_quote_size * Decimal("0.5")
+                bid_size = self.base_quote_size * 1.5
+                ask_size = self.base_quote_size * 0.5
         
         # Anti-crossing check
         best_bid, best_ask = self._get_best_prices(orderbook)
         
         # Don't bid above best ask (would cross)
         if best_ask and bid_price >= best_ask:
-            bid_price = best_ask - Decimal("0.01")
+            bid_price = best_ask - 0.01
         
         # Don't ask below best bid (would cross)
         if best_bid and ask_price <= best_bid:
-            ask_price = best_bid + Decimal("0.01")
+            ask_price = best_bid + 0.01
         
         # Validate prices
-        if bid_price <= Decimal("0") or bid_price >= Decimal("1"):
+        if bid_price <= 0.0 or bid_price >= 1.0:
             bid_quote = None
         else:
             bid_quote = Quote(
                 token_id=token_id,
                 side="BUY",
-                price=bid_price,
+                price=round(bid_price, 4),
                 size=bid_size
             )
         
-        if ask_price <= Decimal("0") or ask_price >= Decimal("1"):
+        if ask_price <= 0.0 or ask_price >= 1.0:
             ask_quote = None
         else:
             ask_quote = Quote(
                 token_id=token_id,
                 side="SELL",
-                price=ask_price,
+                price=round(ask_price, 4),
                 size=ask_size
             )
         
@@ -156,33 +155,17 @@ class MarketMakerEngine:
     
     def _get_best_prices(
         self,
-        orderbook: dict
-    ) -> Tuple[Optional[Decimal], Optional[Decimal]]:
+        orderbook: OrderBook
+    ) -> Tuple[Optional[float], Optional[float]]:
         """Extract best bid and ask from orderbook."""
-        best_bid = None
-        best_ask = None
-        
-        bids = orderbook.get("bids", [])
-        asks = orderbook.get("asks", [])
-        
-        if bids:
-            best_bid = Decimal(str(
-                max(float(b.get("price", 0)) for b in bids)
-            ))
-        
-        if asks:
-            best_ask = Decimal(str(
-                min(float(a.get("price", 999)) for a in asks)
-            ))
-        
-        return (best_bid, best_ask)
+        return (orderbook.best_bid(), orderbook.best_ask())
     
     def generate_quote_update(
         self,
-        binance_price: Decimal,
-        strike_price: Decimal,
+        binance_price: float,
+        strike_price: float,
         remaining_seconds: int,
-        orderbook: dict,
+        orderbook: OrderBook,
         token_id: str
     ) -> Tuple[List[str], List[Quote]]:
         """
@@ -198,7 +181,7 @@ class MarketMakerEngine:
         
         # Don't quote if market is about to close
         if remaining_seconds < 60:
-            return (self.active_orders.copy(), [])
+            return (list(self.active_orders), [])
         
         # Calculate new quotes
         bid_quote, ask_quote = self.calculate_quotes(
@@ -206,7 +189,7 @@ class MarketMakerEngine:
         )
         
         # Build cancel list (all current orders)
-        orders_to_cancel = self.active_orders.copy()
+        orders_to_cancel = list(self.active_orders)
         
         # Build new orders
         new_orders = []
@@ -219,19 +202,18 @@ class MarketMakerEngine:
     
     def record_order_placed(self, order_id: str):
         """Record that an order was placed."""
-        self.active_orders.append(order_id)
+        self.active_orders.add(order_id)
         self.quotes_placed += 1
     
     def record_order_canceled(self, order_id: str):
         """Record that an order was canceled."""
-        if order_id in self.active_orders:
-            self.active_orders.remove(order_id)
+        self.active_orders.discard(order_id)
     
     def record_fill(
         self,
         side: str,
-        size: Decimal,
-        rebate: Decimal = Decimal("0")
+        size: float,
+        rebate: float = 0.0
     ):
         """
         Record a fill and update inventory.
@@ -259,8 +241,8 @@ class MarketMakerEngine:
     
     def get_inventory_value(self, current_price: float) -> float:
         """Calculate current inventory value."""
-        yes_value = float(self.yes_position) * current_price
-        no_value = float(self.no_position) * (1 - current_price)
+        yes_value = self.yes_position * current_price
+        no_value = self.no_position * (1 - current_price)
         return yes_value + no_value
     
     def get_stats(self) -> dict:
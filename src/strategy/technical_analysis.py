@@ -6,12 +6,111 @@ Provides high-performance technical indicators using NumPy.
 Designed for HFT/Algorithmic trading speed.
 """
 
+from functools import lru_cache
+
 import numpy as np
 import structlog
 from typing import Tuple, Optional
 
+from src.utils.jit import njit, NUMBA_AVAILABLE
+
 logger = structlog.get_logger()
 
+# get_trend_state labels, indexed by how many thresholds the price clears
+_TRENDS = ("DOWN", "FLAT", "UP")
+
+
+@njit(cache=True, fastmath=True)
+def _wilder_rsi(prices: np.ndarray, period: int) -> float:
+    """
+    Wilder-smoothed RSI in one pass with scalar accumulators.
+    
+    Same result as the NumPy path in calculate_rsi; only used when Numba
+    is installed (as plain Python the loop is slower than NumPy).
+    """
+    # Seed averages over the first `period` deltas
+    avg_gain = 0.0
+    avg_loss = 0.0
+    for i in range(1, period + 1):
+        delta = prices[i] - prices[i - 1]
+        if delta > 0:
+            avg_gain += delta
+        else:
+            avg_loss -= delta
+    avg_gain /= period
+    avg_loss /= period
+    
+    if avg_loss == 0:
+        return 100.0
+    
+    # Wilder's smoothing over the remaining deltas
+    for i in range(period + 1, prices.shape[0]):
+        delta = prices[i] - prices[i - 1]
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        avg_gain = (avg_gain * (period - 1) + gain) / period
+        avg_loss = (avg_loss * (period - 1) + loss) / period
+    
+    if avg_loss == 0:
+        return 100.0
+    return 100.0 - (100.0 / (1.0 + avg_gain / avg_loss))
+
+
+@lru_cache(maxsize=32)
+def _ema_weights(period: int) -> np.ndarray:
+    """Normalized exponential weights for calculate_ema (built once per period)."""
+    weights = np.exp(np.linspace(-1., 0., period))
+    weights /= weights.sum()
+    weights.flags.writeable = False  # shared across calls
+    return np.ascontiguousarray(weights)
+
+
+class RollingSMA:
+    """
+    Simple moving average updated in O(1) per price.
+    
+    Keeps a running sum over a fixed-size ring buffer, so each update is
+    one subtract/add instead of re-summing the window.
+    """
+    
+    def __init__(self, period: int = 20):
+        """
+        Args:
+            period: Lookback period
+        """
+        self.period = period
+        self._ring = np.zeros(period, dtype=np.float64)
+        self._idx = 0
+        self._count = 0
+        self._sum = 0.0
+    
+    def update(self, price: float) -> float:
+        """
+        Add a price and return the current SMA.
+        
+        Until `period` prices have been seen, returns the latest price
+        (same as TechnicalAnalysis.calculate_sma on a short series).
+        """
+        price = float(price)
+        idx = self._idx
+        
+        # Plain floats throughout: ring reads are np.float64
+        self._sum += price - float(self._ring[idx])
+        self._ring[idx] = price
+        self._idx = (idx + 1) % self.period
+        
+        # Re-sum once per full wrap so float error can't accumulate
+        if self._idx == 0:
+            self._sum = float(self._ring.sum())
+        
+        if self._count < self.period:
+            self._count += 1
+            if self._count < self.period:
+                return price
+        
+        return self._sum / self.period
+
+
 class TechnicalAnalysis:
     """
     Calculates technical indicators from price arrays.
@@ -33,24 +132,17 @@ class TechnicalAnalysis:
             return 50.0
             
         try:
+            if NUMBA_AVAILABLE:
+                return float(_wilder_rsi(np.asarray(prices, dtype=np.float64), period))
+            
             # precise calculation using numpy
-            deltas = np.diff(prices)
-            seed = deltas[:period+1]
-            up = seed[seed >= 0].sum() / period
-            down = -seed[seed < 0].sum() / period
-            rs = up / down if down != 0 else 0
-            rsi = 100. - 100. / (1. + rs)
-
-            # Smooth output for remaining
-            # Note: For HFT/Live, we typically just need the LATEST value,
-            # so strict Wilder's smoothing isn't strictly necessary if window is rolling.
-            # But let's do a simple EMA-like smoothing for recent bars
-            up_val = 0.0
-            down_val = 0.0
+            deltas = np.diff(np.asarray(prices, dtype=np.float64))
             
-            # Recalculate properly for the whole series to match TradingView
-            gains = np.maximum(deltas, 0)
-            losses = -np.minimum(deltas, 0)
+            # Wilder's RSI over the whole series to match TradingView.
+            # Losses are clipped/negated in place, reusing the deltas buffer.
+            gains = np.clip(deltas, 0.0, np.inf)
+            losses = np.clip(deltas, -np.inf, 0.0, out=deltas)
+            np.negative(losses, out=losses)
             
             avg_gain = np.mean(gains[:period])
             avg_loss = np.mean(losses[:period])
@@ -79,15 +171,24 @@ class TechnicalAnalysis:
             return 50.0
 
     @staticmethod
-    def calculate_sma(prices: list, period: int = 20) -> float:
+    def calculate_sma(prices, period: int = 20) -> float:
         """
         Simple Moving Average (SMA).
+        
+        Args:
+            prices: List or float64 ndarray of closing prices
+            period: Lookback period
+        
+        For a value updated on every tick, use RollingSMA instead.
         """
         if len(prices) < period:
-            return prices[-1] if prices else 0.0
+            return float(prices[-1]) if len(prices) else 0.0
             
         try:
-            return float(np.mean(prices[-period:]))
+            window = prices[-period:]
+            if not isinstance(window, np.ndarray):
+                window = np.asarray(window, dtype=np.float64)
+            return float(window.sum() / period)
         except Exception:
             return prices[-1]
             
@@ -97,13 +198,11 @@ class TechnicalAnalysis:
         Exponential Moving Average (EMA).
         """
         if len(prices) < period:
-            return prices[-1] if prices else 0.0
+            return float(prices[-1]) if len(prices) else 0.0
             
         try:
-            weights = np.exp(np.linspace(-1., 0., period))
-            weights /= weights.sum()
-            a = np.array(prices[-period:])
-            return float(np.dot(a, weights))
+            a = np.asarray(prices[-period:], dtype=np.float64)
+            return float(np.dot(a, _ema_weights(period)))
         except Exception:
             return prices[-1]
             
@@ -127,16 +226,20 @@ class TechnicalAnalysis:
         sma = TechnicalAnalysis.calculate_sma(prices, sma_period)
         rsi = TechnicalAnalysis.calculate_rsi(prices)
         
-        # Trend Definition
-        trend = "FLAT"
-        if current_price > sma * 1.0005: # 0.05% buffer
-            trend = "UP"
-        elif current_price < sma * 0.9995:
-            trend = "DOWN"
+        # Trend Definition: 0.05% buffer around the SMA, classified by
+        # indexing with the two threshold tests instead of an if/elif chain
+        if sma == 0:
+            trend = "FLAT"
+            strength = 0.0
+        else:
+            # float(): a np.float64 price would make the tests numpy bools
+            ratio = float(current_price) / sma
+            trend = _TRENDS[(ratio >= 0.9995) + (ratio > 1.0005)]
+            strength = abs(ratio - 1.0)  # Distance from SMA
             
         return {
             "trend": trend,
-            "strength": abs(current_price - sma) / sma, # Distance from SMA
+            "strength": strength,
             "rsi": rsi,
             "sma": sma,
             "current_price": current_price
@@ -0,0 +1,32 @@
+"""
+Cached Timestamps
+==================
+
+Cheap wall-clock timestamps for per-message / per-order bookkeeping.
+"""
+
+import time
+
+# Last formatted second (UTC) and its ISO string
+_cached_second = -1
+_cached_iso = ""
+
+
+def iso_now_cached() -> str:
+    """
+    Current UTC time as an ISO-8601 string, second resolution.
+    
+    The string is formatted once per second and reused, so hot paths
+    pay an int compare instead of a datetime.isoformat() call.
+    
+    Returns:
+        e.g. "2026-01-22T14:03:07Z"
+    """
+    global _cached_second, _cached_iso
+    
+    now = int(time.time())
+    if now != _cached_second:
+        _cached_iso = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _cached_second = now
+    
+    return _cached_iso
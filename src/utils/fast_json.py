@@ -0,0 +1,15 @@
+"""
+Optional orjson Parsing
+========================
+
+`json_loads` from orjson when it is installed, otherwise the stdlib
+`json.loads`, so the feeds parse frames without a hard dependency.
+"""
+
+import json
+
+try:
+    # Parses bytes directly; ~3x faster than stdlib json
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
@@ -0,0 +1,23 @@
+"""
+Optional Numba JIT
+===================
+
+`njit` from numba when it is installed, otherwise a no-op decorator, so
+numeric kernels run as plain Python/NumPy without the dependency.
+"""
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    
+    def njit(*args, **kwargs):
+        """Fallback: return the function unchanged (accepts @njit and @njit(...))."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        
+        def decorator(func):
+            return func
+        
+        return decorator
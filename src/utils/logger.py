@@ -6,9 +6,123 @@ Configures structured logging for the bot with JSON output support.
 """
 
 import sys
+import json
+import atexit
+import queue
+import threading
 import logging
+import logging.handlers
 import structlog
-from typing import Optional
+from typing import Any, Dict, Optional
+
+try:
+    import orjson
+    
+    def _json_dumps(obj, option: int = 0, **kwargs) -> str:
+        """orjson-backed serializer for JSONRenderer (~3-6x stdlib json)."""
+        # NumPy scalars (e.g. np.float64 edges) as numbers, like json.dumps,
+        # instead of falling through to the str() default handler
+        option |= orjson.OPT_SERIALIZE_NUMPY
+        # stdlib handlers format str messages, so decode the bytes once here
+        return orjson.dumps(obj, option=option, **kwargs).decode()
+except ImportError:
+    _json_dumps = json.dumps
+
+# Background thread that owns the real handlers (see configure_logging)
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# Arguments of the last configure_logging call (None until configured)
+_configured_with: Optional[tuple] = None
+
+
+class BufferedFileHandler(logging.Handler):
+    """
+    File handler that batches writes in a 64 KB buffer.
+    
+    logging.FileHandler flushes after every record (one write() syscall
+    per line). This one flushes on ERROR or worse, on close, and
+    otherwise from a daemon thread every `flush_interval`, so a quiet
+    log still reaches the file within that time. Records still
+    buffered when the process crashes are lost.
+    """
+    
+    def __init__(
+        self,
+        filename: str,
+        buffer_size: int = 65536,
+        flush_interval: float = 1.0
+    ):
+        """
+        Args:
+            filename: Log file path (appended to)
+            buffer_size: Write buffer size in bytes
+            flush_interval: Max seconds a routine record stays buffered
+        """
+        super().__init__()
+        self._stream = open(filename, "ab", buffering=buffer_size)
+        self._flush_interval = flush_interval
+        self._dirty = False
+        
+        self._stop_flush = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically,
+            name="log-flush",
+            daemon=True
+        )
+        self._flusher.start()
+    
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._stream.write(self.format(record).encode() + b"\n")
+            
+            if record.levelno >= logging.ERROR:
+                self._stream.flush()
+                self._dirty = False
+            else:
+                self._dirty = True
+        except Exception:
+            self.handleError(record)
+    
+    def _flush_periodically(self):
+        """Flusher thread: write out buffered records until close()."""
+        while not self._stop_flush.wait(self._flush_interval):
+            if self._dirty:
+                self.flush()
+    
+    def flush(self):
+        with self.lock:
+            if not self._stream.closed:
+                self._stream.flush()
+                self._dirty = False
+    
+    def close(self):
+        self._stop_flush.set()
+        with self.lock:
+            if not self._stream.closed:
+                self._stream.close()
+        super().close()
+
+
+# Skip this module too, so the dump ends at the caller, not at the wrapper
+_stack_info_renderer = structlog.processors.StackInfoRenderer(
+    additional_ignores=[__name__]
+)
+
+
+def _format_stack_and_exc(logger, method_name: str, event_dict: dict) -> dict:
+    """
+    StackInfoRenderer + format_exc_info, only for events that ask for them.
+    
+    Routine info/debug events carry neither key, so they skip both
+    processors with two dict lookups.
+    """
+    if "stack_info" in event_dict:
+        event_dict = _stack_info_renderer(logger, method_name, event_dict)
+    if "exc_info" in event_dict:
+        event_dict = structlog.processors.format_exc_info(
+            logger, method_name, event_dict
+        )
+    return event_dict
 
 
 def configure_logging(
@@ -23,7 +137,16 @@ def configure_logging(
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
         json_output: If True, output JSON formatted logs
         log_file: Optional file path for log output
+    
+    Repeat calls with the same arguments are no-ops, so handlers and the
+    log file descriptor aren't torn down and rebuilt.
     """
+    global _listener, _configured_with
+    
+    settings_key = (level.upper(), json_output, log_file)
+    if settings_key == _configured_with:
+        return
+    
     # Convert level string to logging constant
     log_level = getattr(logging, level.upper(), logging.INFO)
     
@@ -31,15 +154,29 @@ def configure_logging(
     handlers = [logging.StreamHandler(sys.stdout)]
     
     if log_file:
-        handlers.append(logging.FileHandler(log_file))
+        handlers.append(BufferedFileHandler(log_file))
+    
+    # Log calls only enqueue the record; a listener thread does the
+    # formatting and stream/file writes off the event loop
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+    
+    log_queue = queue.SimpleQueue()
+    _listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
     
     logging.basicConfig(
         format="%(message)s",
         level=log_level,
-        handlers=handlers,
+        handlers=[logging.handlers.QueueHandler(log_queue)],
         force=True
     )
     
+    _listener.start()
+    
     # Configure structlog
     if json_output:
         # JSON output for production
@@ -47,33 +184,52 @@ def configure_logging(
             structlog.stdlib.add_log_level,
             structlog.stdlib.add_logger_name,
             structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
+            _format_stack_and_exc,
             structlog.processors.UnicodeDecoder(),
-            structlog.processors.JSONRenderer()
+            structlog.processors.JSONRenderer(serializer=_json_dumps)
         ]
     else:
         # Pretty console output for development
         processors = [
             structlog.stdlib.add_log_level,
             structlog.processors.TimeStamper(fmt="%H:%M:%S"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
+            _format_stack_and_exc,
             structlog.dev.ConsoleRenderer(colors=True)
         ]
     
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Calls below log_level return at the call site, before any
+        # processor runs (stdlib.BoundLogger would build the event first)
+        wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
+    
+    # Only remembered once setup succeeded, so a failed call can be retried
+    _configured_with = settings_key
+
+
+def _stop_listener():
+    """Flush queued records at interpreter exit."""
+    if _listener is not None:
+        _listener.stop()
+
+
+atexit.register(_stop_listener)
+
+
+# get_logger cache: one proxy per name for the life of the process
+_LOGGERS: Dict[Optional[str], Any] = {}
 
 
 def get_logger(name: Optional[str] = None):
     """
-    Get a configured logger instance.
+    Get a configured logger instance (one cached proxy per name).
+    
+    structlog returns a lazy proxy that binds to the configuration on
+    first use, so caching it is safe even before configure_logging.
     
     Args:
         name: Optional logger name
@@ -81,4 +237,7 @@ def get_logger(name: Optional[str] = None):
     Returns:
         structlog BoundLogger instance
     """
-    return structlog.get_logger(name)
+    logger = _LOGGERS.get(name)
+    if logger is None:
+        logger = _LOGGERS[name] = structlog.get_logger(name)
+    return logger
@@ -6,8 +6,9 @@ Implements rate limiting to prevent API throttling.
 """
 
 import asyncio
-import time
-from typing import Optional
+from functools import lru_cache
+from time import monotonic_ns as _monotonic_ns
+from typing import List
 
 
 class TokenBucketRateLimiter:
@@ -16,23 +17,110 @@ class TokenBucketRateLimiter:
     
     Polymarket allows up to 350 orders/second, but we use
     a conservative limit to avoid issues.
+    
+    Implemented as virtual scheduling (GCRA): instead of a token count,
+    keep the time at which the bucket is next empty (`_tail_ns`). Each
+    acquisition pushes it forward by tokens / rate, and the caller waits
+    for however far it lands past now. Event-loop tasks only switch at
+    awaits, so the read-modify-write needs no lock, and each caller's
+    slot is reserved on arrival: admission is FIFO with no polling,
+    condition variable or refill task.
+    
+    Times are integer nanoseconds (time.monotonic_ns), so the schedule
+    doesn't lose float resolution over long uptimes.
+    
+    The rate adapts (AIMD) when callers report outcomes: record_success()
+    adds a fixed step, record_failure() (e.g. HTTP 429) multiplies it down.
     """
     
+    # Small value object; may be instantiated per market/endpoint
+    __slots__ = (
+        "rate", "capacity", "_ns_per_token", "_burst_ns", "_tail_ns",
+        "_min_rate", "_max_rate", "_rate_increase", "_rate_decrease"
+    )
+    
     def __init__(
         self,
         rate: float = 50.0,  # tokens per second
-        capacity: float = 50.0  # max tokens in bucket
+        capacity: float = 50.0,  # max tokens in bucket
+        min_rate: float = 1.0,
+        max_rate: float = 350.0,  # Polymarket's order cap
+        rate_increase: float = 1.0,
+        rate_decrease: float = 0.5
     ):
         """
         Args:
             rate: Tokens added per second
             capacity: Maximum tokens the bucket can hold
+            min_rate: Floor for the adaptive rate
+            max_rate: Ceiling for the adaptive rate
+            rate_increase: Tokens/second added per record_success()
+            rate_decrease: Rate multiplier per record_failure()
         """
-        self.rate = rate
         self.capacity = capacity
-        self.tokens = capacity
-        self.last_update = time.monotonic()
-        self._lock = asyncio.Lock()
+        self._min_rate = min_rate
+        self._max_rate = max_rate
+        self._rate_increase = rate_increase
+        self._rate_decrease = rate_decrease
+        self.set_rate(rate)
+        
+        self._tail_ns = _monotonic_ns() - self._burst_ns  # full bucket
+    
+    def set_rate(self, rate: float):
+        """
+        Change the refill rate at runtime (e.g. back off after throttling).
+        
+        Takes effect for the next acquisition. Callers already waiting keep
+        the slot they reserved, so admission stays in arrival order.
+        
+        Args:
+            rate: Tokens added per second
+        """
+        self.rate = rate
+        
+        # Precomputed: ns per token, and ns to refill from empty
+        self._ns_per_token = 1e9 / rate
+        self._burst_ns = round(self.capacity * self._ns_per_token)
+    
+    def record_success(self):
+        """Request went through: probe for more throughput (additive)."""
+        if self.rate < self._max_rate:
+            self.set_rate(min(self._max_rate, self.rate + self._rate_increase))
+    
+    def record_failure(self):
+        """
+        Request was throttled: back off (multiplicative) and empty the bucket.
+        
+        Typical use:
+        
+            await limiter.acquire()
+            try:
+                resp = await request()
+                limiter.record_success()
+            except RateLimited:  # e.g. HTTP 429
+                limiter.record_failure()
+        """
+        self.set_rate(max(self._min_rate, self.rate * self._rate_decrease))
+        
+        # No burst right after a 429: the next slot is one token away
+        now = _monotonic_ns()
+        if self._tail_ns < now:
+            self._tail_ns = now
+    
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        return min(
+            self.capacity,
+            (_monotonic_ns() - self._tail_ns) / self._ns_per_token
+        )
+    
+    def _next_tail(self, now: int, tokens: float) -> int:
+        """Bucket-empty time (ns) after taking `tokens` at `now`."""
+        # An idle bucket refills to at most `capacity` tokens
+        tail = self._tail_ns
+        floor = now - self._burst_ns
+        return (tail if tail > floor else floor) + round(tokens * self._ns_per_token)
     
     async def acquire(self, tokens: float = 1.0) -> float:
         """
@@ -40,42 +128,53 @@ class TokenBucketRateLimiter:
         
         Blocks if not enough tokens available.
         
+        If the waiting task is cancelled, its slot is handed back only
+        when no later caller has queued behind it; otherwise it stays
+        spent, so callers already waiting keep their place.
+        
         Args:
             tokens: Number of tokens to acquire
         
         Returns:
             Time waited (seconds)
         """
-        async with self._lock:
-            wait_time = 0.0
-            
-            # Refill bucket based on time elapsed
-            now = time.monotonic()
-            elapsed = now - self.last_update
-            self.tokens = min(
-                self.capacity,
-                self.tokens + elapsed * self.rate
-            )
-            self.last_update = now
-            
-            # Check if we need to wait
-            if tokens > self.tokens:
-                # Calculate wait time
-                deficit = tokens - self.tokens
-                wait_time = deficit / self.rate
-                
-                await asyncio.sleep(wait_time)
-                
-                # Refill after waiting
-                self.tokens = min(
-                    self.capacity,
-                    self.tokens + wait_time * self.rate
-                )
-            
-            # Consume tokens
-            self.tokens -= tokens
-            
-            return wait_time
+        now = _monotonic_ns()
+        tail = self._next_tail(now, tokens)
+        self._tail_ns = tail  # reserved before sleeping; later callers queue behind
+        
+        if tail <= now:
+            return 0.0
+        
+        wait_time = (tail - now) / 1e9
+        try:
+            await asyncio.sleep(wait_time)
+        except asyncio.CancelledError:
+            if self._tail_ns == tail:
+                self._tail_ns = tail - round(tokens * self._ns_per_token)
+            raise
+        return wait_time
+    
+    def batch_acquire(self, n: int) -> List[float]:
+        """
+        Reserve `n` single-token slots at once, for a fan-out of requests.
+        
+        Does not sleep: returns each slot's delay so every sender can
+        `await asyncio.sleep(delay)` on its own, instead of making n
+        separate acquire() calls.
+        
+        Args:
+            n: Number of tokens (requests) to reserve
+        
+        Returns:
+            Seconds until each slot may proceed, in slot order
+        """
+        now = _monotonic_ns()
+        start = self._next_tail(now, 0.0)
+        step = self._ns_per_token
+        
+        self._tail_ns = start + round(n * step)
+        
+        return [max(0.0, (start + (i + 1) * step - now) / 1e9) for i in range(n)]
     
     def try_acquire(self, tokens: float = 1.0) -> bool:
         """
@@ -87,20 +186,14 @@ class TokenBucketRateLimiter:
         Returns:
             True if tokens were acquired, False if not available
         """
-        # Refill bucket
-        now = time.monotonic()
-        elapsed = now - self.last_update
-        self.tokens = min(
-            self.capacity,
-            self.tokens + elapsed * self.rate
-        )
-        self.last_update = now
+        now = _monotonic_ns()
+        tail = self._next_tail(now, tokens)
         
-        if tokens <= self.tokens:
-            self.tokens -= tokens
-            return True
+        if tail > now:
+            return False
         
-        return False
+        self._tail_ns = tail
+        return True
     
     def get_wait_time(self, tokens: float = 1.0) -> float:
         """
@@ -112,28 +205,18 @@ class TokenBucketRateLimiter:
         Returns:
             Estimated wait time in seconds
         """
-        # Refill bucket
-        now = time.monotonic()
-        elapsed = now - self.last_update
-        current_tokens = min(
-            self.capacity,
-            self.tokens + elapsed * self.rate
-        )
-        
-        if tokens <= current_tokens:
-            return 0.0
-        
-        deficit = tokens - current_tokens
-        return deficit / self.rate
+        now = _monotonic_ns()
+        return max(0, self._next_tail(now, tokens) - now) / 1e9
     
     def reset(self):
         """Reset the bucket to full capacity."""
-        self.tokens = self.capacity
-        self.last_update = time.monotonic()
+        self._tail_ns = _monotonic_ns() - self._burst_ns
 
 
-# Global rate limiter instance
-_global_limiter: Optional[TokenBucketRateLimiter] = None
+@lru_cache(maxsize=None)
+def _shared_limiter(rate: float, capacity: float) -> TokenBucketRateLimiter:
+    """One limiter per (rate, capacity), built on first use."""
+    return TokenBucketRateLimiter(rate, capacity)
 
 
 def get_rate_limiter(
@@ -141,13 +224,11 @@ def get_rate_limiter(
     capacity: float = 50.0
 ) -> TokenBucketRateLimiter:
     """
-    Get the global rate limiter instance.
+    Get the shared rate limiter for these settings.
     
-    Creates one if it doesn't exist.
+    Creates one on first use; later calls with the same (rate, capacity)
+    return the same instance.
     """
-    global _global_limiter
-    
-    if _global_limiter is None:
-        _global_limiter = TokenBucketRateLimiter(rate, capacity)
-    
-    return _global_limiter
+    # Normalized positional key: get_rate_limiter() and
+    # get_rate_limiter(capacity=50) must hit the same cache entry
+    return _shared_limiter(float(rate), float(capacity))
@@ -1,10 +1,29 @@
 """Test the updated market discovery."""
 import asyncio
+import time
 from src.data.market_discovery import discover_15min_btc_markets
 
+# Discovery calls run concurrently, to surface per-call latency
+CONCURRENT_RUNS = 3
+
+async def timed_discovery():
+    """Run one discovery call and return (markets, seconds)."""
+    start = time.perf_counter()
+    markets = await discover_15min_btc_markets()
+    return markets, time.perf_counter() - start
+
 async def main():
     print("Testing updated market discovery...")
-    markets = await discover_15min_btc_markets()
+    start = time.perf_counter()
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(timed_discovery()) for _ in range(CONCURRENT_RUNS)]
+    total = time.perf_counter() - start
+    
+    timings = [task.result()[1] for task in tasks]
+    print(f"{CONCURRENT_RUNS} concurrent calls in {total:.2f}s "
+          f"(per call: min {min(timings):.2f}s, max {max(timings):.2f}s)")
+    
+    markets = tasks[0].result()[0]
     print(f"\nFound {len(markets)} BTC 15m markets:\n")
     
     for m in markets[:5]:
@@ -0,0 +1,113 @@
+import sys
+import os
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data import binance_feed
+from src.data.binance_feed import BinancePriceFeed, _extract_tick
+
+SPOT_FRAME = (
+    b'{"e":"aggTrade","E":1737500000123,"s":"BTCUSDT","a":12345,'
+    b'"p":"95000.50","q":"0.012","f":100,"l":105,"T":1737500000100,'
+    b'"m":true,"M":true}'
+)
+FUTURES_FRAME = (
+    b'{"e":"aggTrade","E":1737500000123,"a":5933014,"s":"BTCUSDT",'
+    b'"p":"95001.10","q":"0.500","nq":"0.500","f":100,"l":105,'
+    b'"T":1737500000101,"m":false}'
+)
+COMBINED_FRAME = (
+    b'{"stream":"btcusdt@aggTrade","data":{"e":"aggTrade","s":"BTCUSDT",'
+    b'"p":"95002.00","q":"0.1","T":1737500000102}}'
+)
+# Key order the scanner doesn't expect ("T" before "p")
+REORDERED_FRAME = (
+    b'{"e":"aggTrade","T":1737500000103,"s":"BTCUSDT","p":"95003.25",'
+    b'"q":"0.1"}'
+)
+SPACED_FRAME = (
+    b'{"e": "aggTrade", "s": "BTCUSDT", "p": "95004.75", "q": "0.1", '
+    b'"T": 1737500000104}'
+)
+SPACED_COMBINED_FRAME = (
+    b'{"stream": "btcusdt@aggTrade", "data": {"e": "aggTrade", '
+    b'"p": "95005.00", "T": 1737500000105}}'
+)
+
+
+@pytest.mark.parametrize("frame,price,timestamp_ms", [
+    (SPOT_FRAME, 95000.50, 1737500000100),
+    (FUTURES_FRAME, 95001.10, 1737500000101),
+    (COMBINED_FRAME, 95002.00, 1737500000102),
+], ids=["spot", "futures", "combined"])
+def test_extract_tick(frame, price, timestamp_ms):
+    """The byte scanner reads price and trade time from compact frames"""
+    assert _extract_tick(frame) == (price, timestamp_ms)
+
+
+@pytest.mark.parametrize("frame", [REORDERED_FRAME, SPACED_FRAME, b'{"e":"ping"}'])
+def test_extract_tick_rejects_other_layouts(frame):
+    """Layouts the scanner can't read raise ValueError (-> full parse)"""
+    with pytest.raises(ValueError):
+        _extract_tick(frame)
+
+
+@pytest.fixture
+def feed():
+    ticks = []
+    
+    async def on_price_update(price, timestamp_ms):
+        ticks.append((price, timestamp_ms))
+    
+    feed = BinancePriceFeed(on_price_update)
+    feed.ticks = ticks
+    return feed
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    """Record frames that reach the full-parse fallback"""
+    calls = []
+    json_loads = binance_feed._json_loads
+    
+    def spy(message):
+        calls.append(message)
+        return json_loads(message)
+    
+    monkeypatch.setattr(binance_feed, "_json_loads", spy)
+    return calls
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("frame,tick,parsed", [
+    (SPOT_FRAME, (95000.50, 1737500000100), False),
+    (FUTURES_FRAME, (95001.10, 1737500000101), False),
+    (COMBINED_FRAME, (95002.00, 1737500000102), False),
+    (REORDERED_FRAME, (95003.25, 1737500000103), True),
+    (SPACED_FRAME, (95004.75, 1737500000104), True),
+    (SPACED_COMBINED_FRAME, (95005.00, 1737500000105), True),
+], ids=["spot", "futures", "combined", "reordered", "spaced", "spaced_combined"])
+async def test_handle_message(feed, parse_calls, frame, tick, parsed):
+    """Every layout yields the same tick; only odd ones take the full parse"""
+    await feed._handle_message(frame)
+    
+    assert feed.ticks == [tick]
+    assert (feed.current_price, feed.last_update_ms) == tick
+    assert parse_calls == ([frame] if parsed else [])
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("frame", [
+    b'{"e": "aggTrade", "p": "not-a-price", "T": 1737500000106}',
+    b'{"e": "aggTrade", "T": 1737500000107}',
+    b'not json',
+], ids=["bad_price", "no_price", "not_json"])
+async def test_handle_message_drops_bad_frames(feed, frame):
+    """Malformed frames are logged and dropped, not raised"""
+    await feed._handle_message(frame)
+    
+    assert feed.ticks == []
+    assert feed.messages_received == 0
@@ -1,59 +1,75 @@
-import unittest
 import sys
 import os
-from decimal import Decimal
+
+import numpy as np
+import pytest
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.strategy.fair_value import FairValueCalculator
 
-class TestFairValueCalculator(unittest.TestCase):
-    def setUp(self):
-        self.calculator = FairValueCalculator(annual_volatility=0.8)
+# (current, strike, remaining_seconds, expected, tolerance)
+CASES = [
+    (90000.0, 90000.0, 300, 0.50, 0.02),  # at strike: roughly a coin flip
+    (91000.0, 90000.0, 60, 0.95, 0.05),   # well above strike: > 0.90
+    (89000.0, 90000.0, 60, 0.05, 0.05),   # well below strike: < 0.10
+    (90001.0, 90000.0, 0, 1.0, 0.0),      # expired above strike: YES won
+    (89999.0, 90000.0, 0, 0.0, 0.0),      # expired below strike: NO won
+]
+
+
+@pytest.fixture(scope="module")
+def calculator():
+    return FairValueCalculator(annual_volatility=0.8)
+
+
+@pytest.mark.parametrize("current,strike,remaining,expected,tol", CASES)
+def test_scalar_cases(calculator, current, strike, remaining, expected, tol):
+    """Scalar probabilities land near the expected value for each case"""
+    prob = calculator.calculate_fair_probability(
+        current_price=current,
+        strike_price=strike,
+        remaining_seconds=remaining
+    )
+    assert prob == pytest.approx(expected, abs=tol)
+
+
+def test_batch_cases(calculator):
+    """The vectorized path matches every case in one call"""
+    current, strike, remaining, expected, tol = (np.array(col) for col in zip(*CASES))
+    
+    probs = calculator.calculate_fair_probability_batch(current, strike, remaining)
+    
+    assert probs.shape == (len(CASES),)
+    assert np.all(np.abs(probs - expected) <= tol)
+
+
+def test_batch_matches_scalar(calculator):
+    """Batch probabilities equal the scalar path, edge cases included"""
+    spots = [90000.0, 91000.0, 89000.0, 90001.0, 89999.0, 90500.0]
+    strikes = [90000.0, 90000.0, 90000.0, 90000.0, 90000.0, 91000.0]
+    remaining = [300, 60, 60, 0, 0, 900]
+    
+    batch = calculator.calculate_fair_probability_batch(spots, strikes, remaining)
+    
+    scalar = [
+        calculator.calculate_fair_probability(s, k, r)
+        for s, k, r in zip(spots, strikes, remaining)
+    ]
+    assert batch == pytest.approx(scalar, abs=5e-13)
+
+
+@pytest.mark.parametrize("remaining", [900, 60, 0])
+def test_strike_grid_matches_scalar(remaining):
+    """float32 grid probabilities track the float64 scalar path"""
+    # Own calculator: set_strike_grid mutates it
+    calculator = FairValueCalculator(annual_volatility=0.8)
+    strikes = [89000.0, 89500.0, 90000.0, 90500.0, 91000.0]
+    calculator.set_strike_grid(strikes)
+    
+    grid = calculator.calculate_fair_probability_grid(90100.0, remaining)
+    assert grid.dtype == np.float32
     
-    def test_fair_probability_at_strike(self):
-        """At current = strike, probability should be roughly 0.50"""
-        prob = self.calculator.calculate_fair_probability(
-            current_price=Decimal("90000"),
-            strike_price=Decimal("90000"),
-            remaining_seconds=300
-        )
-        self.assertTrue(0.48 <= prob <= 0.52)
-        
-    def test_high_probability(self):
-        """Current > Strike should yield high probability"""
-        prob = self.calculator.calculate_fair_probability(
-            current_price=Decimal("91000"),
-            strike_price=Decimal("90000"),
-            remaining_seconds=60
-        )
-        self.assertGreater(prob, 0.90)
-        
-    def test_low_probability(self):
-        """Current < Strike should yield low probability"""
-        prob = self.calculator.calculate_fair_probability(
-            current_price=Decimal("89000"),
-            strike_price=Decimal("90000"),
-            remaining_seconds=60
-        )
-        self.assertLess(prob, 0.10)
-        
-    def test_expired_market(self):
-        """Expired market logic check"""
-        prob = self.calculator.calculate_fair_probability(
-            current_price=Decimal("90001"),
-            strike_price=Decimal("90000"),
-            remaining_seconds=0
-        )
-        self.assertEqual(prob, 1.0)
-        
-        prob = self.calculator.calculate_fair_probability(
-            current_price=Decimal("89999"),
-            strike_price=Decimal("90000"),
-            remaining_seconds=0
-        )
-        self.assertEqual(prob, 0.0)
-
-if __name__ == "__main__":
-    unittest.main()
+    scalar = [calculator.calculate_fair_probability(90100.0, k, remaining) for k in strikes]
+    assert grid.tolist() == pytest.approx(scalar, abs=5e-5)
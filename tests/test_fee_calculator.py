@@ -0,0 +1,62 @@
+import unittest
+import sys
+import os
+from decimal import Decimal
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.risk.fee_calculator import DynamicFeeCalculator, SIDE_YES, SIDE_NO
+
+class TestDynamicFeeCalculator(unittest.TestCase):
+    def setUp(self):
+        self.calculator = DynamicFeeCalculator(max_fee_bps=315)
+    
+    def test_fee_matches_parabola(self):
+        """Table lookup equals max_fee × 4p(1-p) on the cent grid"""
+        for cents in range(0, 101):
+            p = cents / 100
+            expected = 0.0315 * 4 * p * (1 - p)
+            fee = self.calculator.calculate_taker_fee(Decimal(str(p)))
+            self.assertAlmostEqual(fee, expected, places=12)
+        
+    def test_peak_and_extremes(self):
+        """Max fee at 50c, zero at (and beyond) the edges"""
+        self.assertAlmostEqual(self.calculator.calculate_taker_fee(0.5), 0.0315)
+        self.assertEqual(self.calculator.calculate_taker_fee(0.0), 0.0)
+        self.assertEqual(self.calculator.calculate_taker_fee(1.0), 0.0)
+        self.assertEqual(self.calculator.calculate_taker_fee(1.5), 0.0)
+        self.assertEqual(self.calculator.calculate_taker_fee(-0.2), 0.0)
+        
+    def test_batch_matches_scalar(self):
+        """Vectorized lookup agrees with the scalar path"""
+        prices = np.array([0.05, 0.29, 0.5, 0.71, 0.95])
+        fees = self.calculator.calculate_taker_fee_batch(prices)
+        for p, fee in zip(prices, fees):
+            self.assertAlmostEqual(fee, self.calculator.calculate_taker_fee(p))
+    
+    def test_edge_after_fees(self):
+        """Fused edge equals fair value minus fee-inclusive cost, per side"""
+        fee = self.calculator.calculate_taker_fee(0.40)
+        yes_edge = self.calculator.edge_after_fees(0.40, 0.55, SIDE_YES)
+        no_edge = self.calculator.edge_after_fees(0.40, 0.55, SIDE_NO)
+        self.assertAlmostEqual(yes_edge, 0.55 - 0.40 * (1 + fee))
+        self.assertAlmostEqual(no_edge, 0.45 - 0.40 * (1 + fee))
+        
+        ok, profit = self.calculator.is_profitable_entry(0.40, 0.55, "BUY")
+        self.assertTrue(ok)
+        self.assertAlmostEqual(profit, yes_edge)
+    
+    def test_edge_batch_matches_scalar(self):
+        """Ladder edge agrees with the scalar edge at every level"""
+        asks = np.array([0.41, 0.45, 0.52, 0.60])
+        edges = self.calculator.edge_after_fees_batch(asks, 0.55, SIDE_YES)
+        for p, edge in zip(asks, edges):
+            self.assertAlmostEqual(
+                edge, self.calculator.edge_after_fees(p, 0.55, SIDE_YES)
+            )
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import sys
+import os
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.orderbook import OrderBook
+from src.risk.fee_calculator import DynamicFeeCalculator, SIDE_YES
+from src.strategy.fair_value import FairValueCalculator
+from src.strategy.latency_arb import NO_SIDE, OracleLatencyEngine, evaluate_tick
+
+BINANCE_PRICE = 90000.0
+
+# (token_id, strike, remaining_seconds, best_bid, best_ask); 0.0 = no level
+LADDER = [
+    ("yes_stale_ask", 89500.0, 300, 0.60, 0.70),   # fair ~0.9: buy YES
+    ("no_stale_bid", 90500.0, 300, 0.40, 0.45),    # fair ~0.1: buy NO
+    ("fair_book", 90000.0, 300, 0.49, 0.51),       # no edge either side
+    ("no_bid", 89500.0, 300, 0.0, 0.70),           # YES only
+    ("no_ask", 90500.0, 300, 0.40, 0.0),           # NO only
+    ("no_ask_deep_itm", 89000.0, 300, 0.60, 0.0),  # NO side loses: none
+    ("empty_book", 89500.0, 300, 0.0, 0.0),
+    ("closing", 89500.0, 29, 0.60, 0.70),          # edge, but < 30s left
+    ("closing_boundary", 89500.0, 30, 0.60, 0.70), # exactly 30s still trades
+]
+
+
+@pytest.fixture
+def engine():
+    return OracleLatencyEngine(
+        FairValueCalculator(annual_volatility=0.8),
+        DynamicFeeCalculator(),
+        min_edge_after_fees=0.02
+    )
+
+
+def _book(token_id, best_bid, best_ask):
+    book = OrderBook()
+    bids = [best_bid] if best_bid > 0.0 else []
+    asks = [best_ask] if best_ask > 0.0 else []
+    book.load_arrays(
+        token_id,
+        np.array(bids), np.full(len(bids), 100.0),
+        np.array(asks), np.full(len(asks), 100.0)
+    )
+    return book
+
+
+def test_evaluate_all_matches_evaluate_opportunity(engine):
+    """The array path takes the same side and price as the per-market kernel"""
+    token_ids, strikes, remaining, bids, asks = (list(col) for col in zip(*LADDER))
+    
+    batch = engine.evaluate_all(
+        BINANCE_PRICE,
+        np.array(strikes),
+        np.array(remaining),
+        np.array(bids),
+        np.array(asks),
+        token_ids
+    )
+    by_token = {opp.token_id: opp for opp in batch}
+    
+    expected = {}
+    for token_id, strike, secs, bid, ask in LADDER:
+        opp = engine.evaluate_opportunity(
+            BINANCE_PRICE, strike, secs, _book(token_id, bid, ask)
+        )
+        if opp is not None:
+            expected[token_id] = opp
+    
+    # The ladder exercises both sides and both one-sided books
+    assert set(expected) == {
+        "yes_stale_ask", "no_stale_bid", "no_bid", "no_ask", "closing_boundary"
+    }
+    assert set(by_token) == set(expected)
+    for token_id, opp in expected.items():
+        got = by_token[token_id]
+        assert (got.side, got.stale_price) == (opp.side, opp.stale_price)
+        assert got.expected_profit == pytest.approx(opp.expected_profit, abs=1e-12)
+        assert got.fair_price == pytest.approx(opp.fair_price, abs=1e-9)
+
+
+@pytest.mark.parametrize("bid,ask,side,price", [
+    (0.60, 0.70, SIDE_YES, 0.70),
+    (0.0, 0.70, SIDE_YES, 0.70),
+    (0.95, 0.0, NO_SIDE, 0.0),   # NO at 0.05 on a ~0.9 YES: no edge
+    (0.0, 0.0, NO_SIDE, 0.0),    # no quotes: the placeholder edge never wins
+])
+def test_evaluate_tick_sides(bid, ask, side, price):
+    """One-sided and empty books only ever trade a quoted side"""
+    fee_table = DynamicFeeCalculator().fee_table
+    
+    got_side, got_price, edge, _ = evaluate_tick(
+        BINANCE_PRICE, 89500.0, 300.0, bid, ask, fee_table, 0.8, 0.02
+    )
+    
+    assert (got_side, got_price) == (side, price)
+    if side == NO_SIDE:
+        assert edge == 0.0
+    else:
+        assert edge >= 0.02
+
+
+def test_evaluate_tick_empty_book_with_negative_min_edge():
+    """Even with no minimum edge, an empty book yields no side"""
+    fee_table = DynamicFeeCalculator().fee_table
+    
+    side, _, _, _ = evaluate_tick(
+        BINANCE_PRICE, 89500.0, 300.0, 0.0, 0.0, fee_table, 0.8, -1.0
+    )
+    
+    assert side == NO_SIDE
@@ -0,0 +1,149 @@
+import sys
+import os
+import json
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.polymarket_feed import PolymarketFeed, apply_level_change
+
+TOKEN = "token-1"
+
+
+def _side(*levels):
+    prices, sizes = zip(*levels) if levels else ((), ())
+    return np.array(prices, dtype=np.float64), np.array(sizes, dtype=np.float64)
+
+
+@pytest.mark.parametrize("price,levels", [
+    (0.40, [(0.40, 5.0), (0.45, 10.0), (0.50, 20.0), (0.55, 30.0)]),
+    (0.48, [(0.45, 10.0), (0.48, 5.0), (0.50, 20.0), (0.55, 30.0)]),
+    (0.60, [(0.45, 10.0), (0.50, 20.0), (0.55, 30.0), (0.60, 5.0)]),
+], ids=["front", "middle", "back"])
+def test_apply_level_change_inserts(price, levels):
+    """A new price is inserted at its sorted position"""
+    prices, sizes = _side((0.45, 10.0), (0.50, 20.0), (0.55, 30.0))
+    
+    prices, sizes = apply_level_change(prices, sizes, price, 5.0)
+    
+    assert list(zip(prices.tolist(), sizes.tolist())) == levels
+
+
+def test_apply_level_change_updates_in_place():
+    """An existing level keeps its arrays and only the size changes"""
+    prices, sizes = _side((0.45, 10.0), (0.50, 20.0), (0.55, 30.0))
+    
+    new_prices, new_sizes = apply_level_change(prices, sizes, 0.50, 25.0)
+    
+    assert new_prices is prices and new_sizes is sizes
+    assert sizes.tolist() == [10.0, 25.0, 30.0]
+
+
+def test_apply_level_change_deletes_on_zero_size():
+    """Size 0 removes the level; removing a missing level is a no-op"""
+    prices, sizes = _side((0.45, 10.0), (0.50, 20.0), (0.55, 30.0))
+    
+    prices, sizes = apply_level_change(prices, sizes, 0.50, 0.0)
+    assert prices.tolist() == [0.45, 0.55]
+    assert sizes.tolist() == [10.0, 30.0]
+    
+    same_prices, same_sizes = apply_level_change(prices, sizes, 0.52, 0.0)
+    assert same_prices is prices and same_sizes is sizes
+
+
+def test_apply_level_change_on_empty_side():
+    """Inserting into and deleting from an empty side both work"""
+    prices, sizes = _side()
+    
+    assert apply_level_change(prices, sizes, 0.50, 0.0)[0].size == 0
+    
+    prices, sizes = apply_level_change(prices, sizes, 0.50, 7.0)
+    assert (prices.tolist(), sizes.tolist()) == ([0.50], [7.0])
+
+
+@pytest.fixture
+def feed():
+    updates = []
+    
+    async def on_orderbook_update(token_id, orderbook):
+        updates.append((
+            token_id,
+            orderbook["bid_prices"].tolist(), orderbook["bid_sizes"].tolist(),
+            orderbook["ask_prices"].tolist(), orderbook["ask_sizes"].tolist()
+        ))
+    
+    feed = PolymarketFeed(on_orderbook_update)
+    feed.updates = updates
+    return feed
+
+
+def _frame(**data):
+    return json.dumps(data).encode()
+
+
+async def _load_book(feed):
+    await feed._handle_message(_frame(
+        type="book",
+        market=TOKEN,
+        bids=[{"price": "0.48", "size": "10"}, {"price": "0.47", "size": "20"}],
+        asks=[{"price": "0.52", "size": "15"}, {"price": "0.53", "size": "25"}]
+    ))
+
+
+def _price_change(*changes):
+    return _frame(
+        type="price_change",
+        market=TOKEN,
+        changes=[
+            {"side": side, "price": price, "size": size}
+            for side, price, size in changes
+        ]
+    )
+
+
+@pytest.mark.asyncio
+async def test_price_change_applies_levels(feed):
+    """Insert, update and delete deltas land in the cached book"""
+    await _load_book(feed)
+    
+    await feed._handle_message(_price_change(
+        ("BUY", "0.49", "5"),     # new best bid
+        ("BUY", "0.47", "0"),     # delete
+        ("SELL", "0.52", "30"),   # update best ask
+    ))
+    
+    assert feed.updates[-1] == (
+        TOKEN, [0.48, 0.49], [10.0, 5.0], [0.52, 0.53], [30.0, 25.0]
+    )
+
+
+@pytest.mark.asyncio
+async def test_price_change_skips_unchanged_top_of_book(feed):
+    """A frame that leaves the top of book and depth alone isn't forwarded"""
+    await _load_book(feed)
+    assert len(feed.updates) == 1
+    
+    # Re-broadcast of the current best bid: no-op
+    await feed._handle_message(_price_change(("BUY", "0.48", "10")))
+    assert len(feed.updates) == 1
+    
+    # Same for a size change behind the top of book
+    await feed._handle_message(_price_change(("SELL", "0.53", "40")))
+    assert len(feed.updates) == 1
+    assert feed.get_orderbook(TOKEN)["ask_sizes"].tolist() == [15.0, 40.0]
+    
+    # The best ask size changes: forwarded
+    await feed._handle_message(_price_change(("SELL", "0.52", "16")))
+    assert len(feed.updates) == 2
+
+
+@pytest.mark.asyncio
+async def test_price_change_without_book_is_ignored(feed):
+    """Deltas for a token with no snapshot yet are dropped"""
+    await feed._handle_message(_price_change(("BUY", "0.49", "5")))
+    
+    assert feed.updates == []
+    assert feed.get_orderbook(TOKEN) is None
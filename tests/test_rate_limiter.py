@@ -0,0 +1,102 @@
+import sys
+import os
+import asyncio
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.utils import rate_limiter
+from src.utils.rate_limiter import TokenBucketRateLimiter
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Frozen monotonic clock (ns); tests advance it by hand"""
+    now = [10**12]
+    monkeypatch.setattr(rate_limiter, "_monotonic_ns", lambda: now[0])
+    return now
+
+
+@pytest.mark.asyncio
+async def test_burst_then_fifo_spacing(clock):
+    """A full bucket admits `capacity` calls at once, then one per 1/rate"""
+    limiter = TokenBucketRateLimiter(rate=1000.0, capacity=2.0)
+    
+    waits = [await limiter.acquire() for _ in range(5)]
+    
+    assert waits == pytest.approx([0.0, 0.0, 0.001, 0.002, 0.003])
+
+
+@pytest.mark.asyncio
+async def test_cancelled_acquire_returns_last_slot(clock):
+    """A cancelled waiter hands its slot back if nobody queued behind it"""
+    limiter = TokenBucketRateLimiter(rate=10.0, capacity=1.0)
+    assert await limiter.acquire() == 0.0
+    
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert limiter.get_wait_time() == pytest.approx(0.2)
+    
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.get_wait_time() == pytest.approx(0.1)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_acquire_keeps_queued_slots(clock):
+    """Cancelling a waiter with others behind it doesn't move their slots"""
+    limiter = TokenBucketRateLimiter(rate=10.0, capacity=1.0)
+    assert await limiter.acquire() == 0.0
+    
+    first = asyncio.create_task(limiter.acquire())
+    second = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    second.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await second
+    
+    # first's slot stays spent; second's (the last) was handed back
+    assert limiter.get_wait_time() == pytest.approx(0.2)
+
+
+def test_try_acquire_does_not_commit_on_failure(clock):
+    """A failed try_acquire leaves the schedule untouched"""
+    limiter = TokenBucketRateLimiter(rate=10.0, capacity=2.0)
+    
+    assert limiter.try_acquire()
+    assert limiter.try_acquire()
+    
+    tail = limiter._tail_ns
+    assert not limiter.try_acquire()
+    assert limiter._tail_ns == tail
+    assert limiter.get_wait_time() == pytest.approx(0.1)
+    
+    clock[0] += 100_000_000  # one token refilled
+    assert limiter.try_acquire()
+
+
+def test_batch_acquire_offsets(clock):
+    """Batch slots use the burst first, then are spaced 1/rate apart"""
+    limiter = TokenBucketRateLimiter(rate=10.0, capacity=2.0)
+    
+    assert limiter.batch_acquire(4) == pytest.approx([0.0, 0.0, 0.1, 0.2])
+    assert limiter.get_wait_time() == pytest.approx(0.3)
+
+
+def test_record_failure_empties_bucket_and_halves_rate(clock):
+    """A 429 halves the rate and removes the burst"""
+    limiter = TokenBucketRateLimiter(rate=10.0, capacity=5.0)
+    assert limiter.tokens == pytest.approx(5.0)
+    
+    limiter.record_failure()
+    
+    assert limiter.rate == 5.0
+    assert limiter.tokens == pytest.approx(0.0)
+    assert limiter.get_wait_time() == pytest.approx(0.2)
@@ -0,0 +1,88 @@
+import sys
+import os
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.risk.risk_manager import RiskManager
+
+# Each case trips its own check plus every lower-priority one, so the
+# reason shows which failing check wins.
+# (id, max_single_trade_usd, max_position_usd, daily_pnl, open_positions,
+#  price, size, expected reason)
+CASES = [
+    ("trade_size", 100.0, 100.0, -600.0, 5, 0.995, 20000,
+     "Trade too large: $19900.00 > $100.00"),
+    ("position_size", 1e6, 100.0, -600.0, 5, 0.995, 20000,
+     "Position too large: $19900.00 > $100.00"),
+    ("daily_loss", 1e6, 1e6, -600.0, 5, 0.995, 20000,
+     "Daily loss limit reached: $600.00"),
+    ("max_positions", 1e6, 1e6, 0.0, 5, 0.995, 20000,
+     "Max positions reached: 5/5"),
+    ("price", 1e6, 1e6, 0.0, 0, 0.995, 20000,
+     "Suspicious price: 0.995"),
+    ("size", 1e6, 1e6, 0.0, 0, 0.5, 20000,
+     "Invalid size: 20000"),
+]
+
+
+@pytest.mark.parametrize(
+    "max_trade,max_position,daily_pnl,open_positions,price,size,reason",
+    [case[1:] for case in CASES],
+    ids=[case[0] for case in CASES]
+)
+def test_reject_priority(
+    max_trade, max_position, daily_pnl, open_positions, price, size, reason
+):
+    """The highest-priority failing check is reported; only daily loss halts"""
+    manager = RiskManager(
+        max_daily_loss_usd=500.0,
+        max_position_usd=max_position,
+        max_open_positions=5,
+        max_single_trade_usd=max_trade
+    )
+    manager.daily_pnl = daily_pnl
+    manager.open_positions = open_positions
+    
+    assert manager.validate_trade(price, size, 0.0, "BUY") == (False, reason)
+    assert manager.trades_rejected == 1
+    assert manager.trades_approved == 0
+    assert manager.is_halted == reason.startswith("Daily loss")
+    assert manager.halt_reason == (reason if manager.is_halted else "")
+
+
+def test_halted_rejects_everything():
+    """After a daily-loss reject, even a clean trade is refused and counted"""
+    manager = RiskManager(max_daily_loss_usd=500.0)
+    manager.daily_pnl = -600.0
+    manager.validate_trade(0.5, 10, 0.0)
+    manager.daily_pnl = 0.0
+    
+    valid, reason = manager.validate_trade(0.5, 10, 0.0)
+    
+    assert not valid
+    assert reason == "Trading halted: Daily loss limit reached: $600.00"
+    assert manager.trades_rejected == 2
+
+
+def test_sell_ignores_position_cap():
+    """SELLs close positions, so a full book doesn't block them"""
+    manager = RiskManager(max_open_positions=5)
+    manager.open_positions = 5
+    
+    assert manager.validate_trade(0.5, 10, 0.0, "SELL") == (True, "OK")
+    assert manager.validate_trade(0.5, 10, 0.0, "BUY") == (
+        False, "Max positions reached: 5/5"
+    )
+    assert (manager.trades_approved, manager.trades_rejected) == (1, 1)
+
+
+def test_approved_trade():
+    """A trade within every limit is approved and counted"""
+    manager = RiskManager()
+    
+    assert manager.validate_trade(0.5, 100, 0.03) == (True, "OK")
+    assert (manager.trades_approved, manager.trades_rejected) == (1, 0)
+    assert not manager.is_halted
@@ -0,0 +1,92 @@
+import sys
+import os
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.strategy import technical_analysis
+from src.strategy.technical_analysis import (
+    RollingSMA, TechnicalAnalysis, _wilder_rsi
+)
+
+_rng = np.random.default_rng(11)
+
+# (name, prices, expected RSI or None to only compare the two paths)
+RSI_SERIES = [
+    ("random", 90000.0 + np.cumsum(_rng.normal(0.0, 25.0, 200)), None),
+    ("monotonic_up", np.arange(100.0, 140.0), 100.0),
+    ("flat", np.full(40, 90000.0), 100.0),
+    ("monotonic_down", np.arange(140.0, 100.0, -1.0), 0.0),
+]
+
+
+@pytest.mark.parametrize("period", [1, 5, 20])
+def test_rolling_sma_matches_calculate_sma(period):
+    """Every incremental update equals the full-window SMA, as a plain float"""
+    rng = np.random.default_rng(7)
+    prices = 90000.0 + np.cumsum(rng.normal(0.0, 25.0, 3 * period + 7))
+    
+    sma = RollingSMA(period)
+    for n in range(1, len(prices) + 1):
+        value = sma.update(prices[n - 1])
+        assert type(value) is float
+        assert value == pytest.approx(
+            TechnicalAnalysis.calculate_sma(prices[:n], period), rel=1e-12
+        )
+
+
+@pytest.mark.parametrize(
+    "prices,expected",
+    [case[1:] for case in RSI_SERIES],
+    ids=[case[0] for case in RSI_SERIES]
+)
+def test_wilder_rsi_matches_numpy_path(monkeypatch, prices, expected):
+    """The one-pass kernel agrees with the NumPy branch of calculate_rsi"""
+    monkeypatch.setattr(technical_analysis, "NUMBA_AVAILABLE", False)
+    numpy_rsi = TechnicalAnalysis.calculate_rsi(prices.tolist(), 14)
+    
+    # py_func is the uncompiled kernel when Numba is installed
+    kernels = {_wilder_rsi, getattr(_wilder_rsi, "py_func", _wilder_rsi)}
+    for kernel in kernels:
+        assert kernel(prices, 14) == pytest.approx(numpy_rsi, abs=1e-9)
+    
+    if expected is not None:
+        assert numpy_rsi == pytest.approx(expected)
+
+
+def _series_with_ratio(ratio, period=20, sma=100.0):
+    """`period` prices whose last price is `ratio` times their mean"""
+    last = ratio * sma
+    return [(sma * period - last) / (period - 1)] * (period - 1) + [last]
+
+
+@pytest.mark.parametrize("as_numpy", [False, True], ids=["float", "np.float64"])
+@pytest.mark.parametrize("ratio,expected", [
+    (0.99, "DOWN"),
+    (0.9994, "DOWN"),
+    (0.9996, "FLAT"),
+    (1.0, "FLAT"),
+    (1.0004, "FLAT"),
+    (1.0006, "UP"),
+    (1.01, "UP"),
+])
+def test_trend_state_boundaries(ratio, expected, as_numpy):
+    """The 0.05% band around the SMA classifies plain and NumPy prices alike"""
+    prices = _series_with_ratio(ratio)
+    if as_numpy:
+        prices = list(np.asarray(prices, dtype=np.float64))
+    
+    state = TechnicalAnalysis.get_trend_state(prices)
+    
+    assert state["trend"] == expected
+    assert state["strength"] == pytest.approx(abs(ratio - 1.0))
+
+
+def test_trend_state_rising_arange():
+    """A list of np.float64 from np.arange trends UP"""
+    prices = list(np.arange(100.0, 140.0))
+    
+    assert TechnicalAnalysis.get_trend_state(prices)["trend"] == "UP"